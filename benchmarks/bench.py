@@ -0,0 +1,220 @@
+"""Benchmark the sensor and sync hot paths against synthetic histories.
+
+Runs fully offline: setlist.fm is replaced by an in-memory client serving
+pages from the synthetic generator. Only Home Assistant itself needs to be
+installed.
+
+    python benchmarks/bench.py                 # run and compare to baseline
+    python benchmarks/bench.py --save          # run and store a new baseline
+    python benchmarks/bench.py --sizes 20 1000 # only some history sizes
+
+Timings depend on the machine, so the stored baseline is only meaningful
+for the machine it was recorded on. Re-record it (--save) before
+comparing a change on a different machine.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+from pathlib import Path
+import sys
+from time import perf_counter
+import tracemalloc
+from types import SimpleNamespace
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from homeassistant.helpers.json import json_bytes  # noqa: E402
+from homeassistant.util.json import json_loads  # noqa: E402
+from synthetic import generate_setlists, paginate  # noqa: E402
+
+from custom_components.setlistfm.api import SetlistFmNotFoundError  # noqa: E402
+from custom_components.setlistfm.models import ConcertIndex  # noqa: E402
+from custom_components.setlistfm.sensor import SetlistFmConcertsSensor  # noqa: E402
+from custom_components.setlistfm.sync import AttendedHistory  # noqa: E402
+
+BASELINE = Path(__file__).with_name("baseline.json")
+SIZES = [20, 1000, 10000, 100000]
+
+# A metric regresses when it is this much worse than the baseline...
+TOLERANCE = 0.5
+# ...and the difference is above the timer/allocator noise floor. State reads
+# vary by about 0.1 ms between runs of an unchanged tree
+NOISE_FLOOR = {"s": 0.002, "ms": 0.5, "bytes": 64, "mb": 0.5}
+
+# Options that render the most attributes the options flow allows
+OPTIONS = {"show_concerts": "all", "number_of_concerts": 50}
+
+
+class OfflineClient:
+    """Serve attended pages from memory, decoding them like the real client."""
+
+    def __init__(self, setlists: list[dict[str, Any]]) -> None:
+        """Pre-encode every page of the history."""
+        self.pages: list[bytes] = []
+        page = 1
+        while (data := paginate(setlists, page)) is not None:
+            self.pages.append(json_bytes(data))
+            page += 1
+        self.requests = 0
+
+    async def async_get_attended_page(
+        self, userid: str, page: int = 1, priority: int = 0, conditional: bool = False
+    ) -> dict[str, Any] | None:
+        """Return a decoded page, or raise 404 past the end like setlist.fm."""
+        self.requests += 1
+        if page > len(self.pages):
+            raise SetlistFmNotFoundError(f"Not found: page {page}")
+        return json_loads(self.pages[page - 1])
+
+
+def _timeit(func, repeat: int, setup=None) -> float:
+    """Return the best wall time of ``repeat`` calls, in seconds.
+
+    ``setup`` runs untimed before each call and its result is passed on.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        args = () if setup is None else (setup(),)
+        started = perf_counter()
+        func(*args)
+        best = min(best, perf_counter() - started)
+    return best
+
+
+def _make_sensor(history: AttendedHistory) -> SetlistFmConcertsSensor:
+    """Build a concerts sensor over the history without a running hass."""
+    coordinator = SimpleNamespace(
+        data={
+            "user": {},
+            "index": ConcertIndex.from_concerts(history.concerts),
+            "stats": history.stats,
+        },
+        last_update_success=True,
+        last_exception=None,
+        last_fetched=None,
+    )
+    entry = SimpleNamespace(
+        entry_id="benchmark",
+        title="benchmark",
+        data={"userid": "benchmark", "name": "Benchmark"},
+        options=OPTIONS,
+    )
+    return SetlistFmConcertsSensor(coordinator, entry)
+
+
+def run_size(loop: asyncio.AbstractEventLoop, size: int) -> dict[str, float]:
+    """Measure one history size."""
+    setlists = generate_setlists(size)
+    client = OfflineClient(setlists)
+    repeat = 5 if size <= 10000 else 2
+
+    def full_ingest() -> AttendedHistory:
+        history = AttendedHistory(keep_songs=True)
+        loop.run_until_complete(history.async_sync(client, "benchmark"))
+        return history
+
+    history = full_ingest()
+    results: dict[str, float] = {
+        "ingest_full_s": _timeit(full_ingest, repeat),
+    }
+
+    # A poll that finds three new shows on page 1
+    older = history.concerts[3:]
+
+    def restored_history() -> AttendedHistory:
+        partial = AttendedHistory(keep_songs=True)
+        partial.restore(older)
+        return partial
+
+    def incremental_ingest(partial: AttendedHistory) -> None:
+        loop.run_until_complete(partial.async_sync(client, "benchmark"))
+
+    results["ingest_incremental_s"] = _timeit(
+        incremental_ingest, repeat, restored_history
+    )
+    results["build_index_s"] = _timeit(
+        lambda: ConcertIndex.from_concerts(history.concerts), repeat
+    )
+
+    sensor = _make_sensor(history)
+
+    def read_state() -> None:
+        sensor.native_value  # noqa: B018
+        sensor.extra_state_attributes  # noqa: B018
+
+    def read_state_after_update() -> None:
+        sensor._data_generation += 1  # pylint: disable=protected-access
+        read_state()
+
+    read_state()
+    results["state_read_warm_ms"] = _timeit(read_state, 50) * 1000
+    results["state_read_cold_ms"] = _timeit(read_state_after_update, 50) * 1000
+    results["attributes_bytes"] = len(json_bytes(sensor.extra_state_attributes))
+
+    del history, sensor
+    tracemalloc.start()
+    history = full_ingest()
+    results["peak_memory_mb"] = tracemalloc.get_traced_memory()[1] / 1_000_000
+    tracemalloc.stop()
+    return results
+
+
+def _unit(metric: str) -> str:
+    return metric.rsplit("_", 1)[1]
+
+
+def compare(results: dict[str, dict[str, float]], baseline: dict) -> list[str]:
+    """Return a description of every metric that regressed."""
+    regressions = []
+    for size, metrics in results.items():
+        for metric, value in metrics.items():
+            if (old := baseline.get(size, {}).get(metric)) is None:
+                continue
+            worse = value - old
+            if worse > NOISE_FLOOR[_unit(metric)] and worse > old * TOLERANCE:
+                regressions.append(
+                    f"{size} shows: {metric} {old:.4g} -> {value:.4g}"
+                )
+    return regressions
+
+
+def main() -> int:
+    """Run the benchmarks."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=SIZES)
+    parser.add_argument("--save", action="store_true", help="store as baseline")
+    args = parser.parse_args()
+
+    loop = asyncio.new_event_loop()
+    results: dict[str, dict[str, float]] = {}
+    for size in args.sizes:
+        results[str(size)] = metrics = run_size(loop, size)
+        print(f"{size} shows")
+        for metric, value in metrics.items():
+            print(f"  {metric:<22} {value:.4g}")
+    loop.close()
+
+    if args.save:
+        baseline = json.loads(BASELINE.read_text()) if BASELINE.exists() else {}
+        baseline.update(results)
+        BASELINE.write_text(json.dumps(baseline, indent=2) + "\n")
+        print(f"Baseline written to {BASELINE}")
+        return 0
+
+    if not BASELINE.exists():
+        print("No baseline to compare to; run with --save first")
+        return 0
+    if regressions := compare(results, json.loads(BASELINE.read_text())):
+        print("Regressions against the baseline:")
+        for regression in regressions:
+            print(f"  {regression}")
+        return 1
+    print("No regressions against the baseline")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,220 @@
+"""Local stand-in for the setlist.fm endpoints used by the integration.
+
+Serves ``/rest/1.0/user/{id}`` and ``/rest/1.0/user/{id}/attended?p=N``
+from synthetic histories, with configurable latency and failure injection.
+
+    python benchmarks/fake_server.py --port 8080 --shows 500 --latency 0.05
+
+Point a client at ``http://127.0.0.1:8080/rest/1.0``. ``GET /stats`` returns
+the requests served so far, by endpoint and status.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+from collections import Counter
+from dataclasses import dataclass
+import hashlib
+import json
+import random
+from time import monotonic
+
+from aiohttp import hdrs, web
+from synthetic import ITEMS_PER_PAGE, generate_setlists, paginate
+
+BASE_PATH = "/rest/1.0"
+
+
+@dataclass
+class FakeServerConfig:
+    """Behaviour of the fake server."""
+
+    shows: int = 200
+    latency: float = 0.0
+    jitter: float = 0.0
+    error_rate: float = 0.0
+    rate_limit_rate: float = 0.0
+    retry_after: int | None = None
+    # Requests per second allowed per API key before answering 429 (0 = no limit)
+    enforce_rate: float = 0.0
+    etags: bool = True
+    seed: int = 1
+
+
+class FakeSetlistFm:
+    """The fake API: one synthetic history, served for every user ID."""
+
+    def __init__(self, config: FakeServerConfig) -> None:
+        """Pre-encode every page of the synthetic history."""
+        self.config = config
+        self.requests: Counter[tuple[str, int]] = Counter()
+        self._random = random.Random(config.seed)
+        self.pages: list[bytes] = []
+        setlists = generate_setlists(config.shows, config.seed)
+        page = 1
+        while (data := paginate(setlists, page)) is not None:
+            self.pages.append(json.dumps(data).encode())
+            page += 1
+        self._buckets: dict[str, tuple[float, float]] = {}
+
+    def app(self) -> web.Application:
+        """Return the aiohttp application."""
+        app = web.Application()
+        app.router.add_get(f"{BASE_PATH}/user/{{userid}}", self._user)
+        app.router.add_get(f"{BASE_PATH}/user/{{userid}}/attended", self._attended)
+        app.router.add_get("/stats", self._stats)
+        return app
+
+    async def _user(self, request: web.Request) -> web.Response:
+        userid = request.match_info["userid"]
+        body = json.dumps(
+            {
+                "userId": userid,
+                "fullname": f"Fake {userid}",
+                "url": f"https://www.setlist.fm/user/{userid}",
+            }
+        ).encode()
+        return await self._respond(request, "user", body)
+
+    async def _attended(self, request: web.Request) -> web.Response:
+        try:
+            page = int(request.query.get("p", "1"))
+        except ValueError:
+            page = 0
+        if not 1 <= page <= len(self.pages):
+            # setlist.fm answers 404 for pages past the end
+            return await self._respond(request, "attended", None)
+        return await self._respond(request, "attended", self.pages[page - 1])
+
+    async def _stats(self, request: web.Request) -> web.Response:
+        return web.json_response(
+            {
+                "requests": sum(self.requests.values()),
+                "by_status": {
+                    f"{endpoint} {status}": count
+                    for (endpoint, status), count in sorted(self.requests.items())
+                },
+            }
+        )
+
+    async def _respond(
+        self, request: web.Request, endpoint: str, body: bytes | None
+    ) -> web.Response:
+        config = self.config
+        if config.latency or config.jitter:
+            await asyncio.sleep(config.latency + self._random.uniform(0, config.jitter))
+
+        status = 200
+        headers: dict[str, str] = {}
+        if self._rate_limited(request) or self._random.random() < config.rate_limit_rate:
+            status = 429
+            if config.retry_after is not None:
+                headers[hdrs.RETRY_AFTER] = str(config.retry_after)
+        elif self._random.random() < config.error_rate:
+            status = 503
+        elif body is None:
+            status = 404
+        elif config.etags:
+            etag = f'"{hashlib.sha256(body).hexdigest()[:16]}"'
+            headers[hdrs.ETAG] = etag
+            if request.headers.get(hdrs.IF_NONE_MATCH) == etag:
+                status = 304
+
+        self.requests[(endpoint, status)] += 1
+        if status != 200:
+            return web.Response(status=status, headers=headers)
+        return web.Response(body=body, headers=headers, content_type="application/json")
+
+    def _rate_limited(self, request: web.Request) -> bool:
+        """Apply a per-key token bucket, like setlist.fm's per-second limit."""
+        rate = self.config.enforce_rate
+        if not rate:
+            return False
+        key = request.headers.get("x-api-key", "")
+        now = monotonic()
+        tokens, updated = self._buckets.get(key, (rate, now))
+        tokens = min(rate, tokens + (now - updated) * rate)
+        if tokens < 1:
+            self._buckets[key] = (tokens, now)
+            return True
+        self._buckets[key] = (tokens - 1, now)
+        return False
+
+
+async def async_start(
+    config: FakeServerConfig, host: str = "127.0.0.1", port: int = 0
+) -> tuple[FakeSetlistFm, web.AppRunner, str]:
+    """Start the fake server; return it, its runner and its API base URL."""
+    fake = FakeSetlistFm(config)
+    runner = web.AppRunner(fake.app(), access_log=None)
+    await runner.setup()
+    site = web.TCPSite(runner, host, port)
+    await site.start()
+    port = runner.addresses[0][1]
+    return fake, runner, f"http://{host}:{port}{BASE_PATH}"
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the fake server options to an argument parser."""
+    group = parser.add_argument_group("fake server")
+    group.add_argument("--shows", type=int, default=200, help="shows per user")
+    group.add_argument("--latency", type=float, default=0.0, help="seconds per request")
+    group.add_argument("--jitter", type=float, default=0.0, help="extra random latency")
+    group.add_argument("--error-rate", type=float, default=0.0, help="share of 503s")
+    group.add_argument(
+        "--rate-limit-rate", type=float, default=0.0, help="share of random 429s"
+    )
+    group.add_argument(
+        "--retry-after", type=int, default=None, help="Retry-After sent with 429s"
+    )
+    group.add_argument(
+        "--enforce-rate",
+        type=float,
+        default=0.0,
+        help="answer 429 above this many requests per second per API key",
+    )
+    group.add_argument("--no-etags", action="store_true", help="don't send ETags")
+
+
+def config_from_args(args: argparse.Namespace) -> FakeServerConfig:
+    """Build the server config from parsed arguments."""
+    return FakeServerConfig(
+        shows=args.shows,
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        rate_limit_rate=args.rate_limit_rate,
+        retry_after=args.retry_after,
+        enforce_rate=args.enforce_rate,
+        etags=not args.no_etags,
+    )
+
+
+async def _async_main(args: argparse.Namespace) -> None:
+    fake, runner, url = await async_start(
+        config_from_args(args), args.host, args.port
+    )
+    print(
+        f"Serving {args.shows} shows ({len(fake.pages)} pages of {ITEMS_PER_PAGE})"
+        f" at {url}"
+    )
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await runner.cleanup()
+
+
+def main() -> None:
+    """Run the fake server until interrupted."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    add_arguments(parser)
+    try:
+        asyncio.run(_async_main(parser.parse_args()))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,161 @@
+"""Run many setlist.fm coordinators against the local fake server.
+
+Starts the fake server in-process, creates N config entries (sharing K API
+keys) in a bare Home Assistant instance and refreshes every coordinator
+for a number of rounds: the first round syncs full histories, later rounds
+are ordinary polls. Reports requests by status, wall time per round and
+peak memory (process RSS, and optionally tracemalloc's peak).
+
+    python benchmarks/load.py --entries 200 --keys 1 --shows 300 --rounds 3
+    python benchmarks/load.py --entries 20 --enforce-rate 2 --retry-after 1
+
+Each entry refreshes the way a poll would, so requests queue in the
+per-key scheduler. By default the harness lifts the scheduler's rate so it
+measures the integration rather than the documented API limits; pass
+--rate 2 to apply those limits.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+from pathlib import Path
+import resource
+import sys
+import tempfile
+from time import perf_counter
+import tracemalloc
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from homeassistant.config_entries import ConfigEntry  # noqa: E402
+from homeassistant.core import HomeAssistant  # noqa: E402
+from homeassistant.helpers.aiohttp_client import (  # noqa: E402
+    async_get_clientsession,
+)
+from fake_server import add_arguments, async_start, config_from_args  # noqa: E402
+
+from custom_components.setlistfm import (  # noqa: E402
+    DATA_SCHEDULERS,
+    SetlistFmCoordinator,
+)
+from custom_components.setlistfm.api import RetryPolicy, SetlistFmClient  # noqa: E402
+from custom_components.setlistfm.const import DOMAIN  # noqa: E402
+from custom_components.setlistfm.scheduler import RequestScheduler  # noqa: E402
+
+
+def _make_entry(number: int, keys: int) -> ConfigEntry:
+    """Build a config entry for a fake user."""
+    return ConfigEntry(
+        version=1,
+        minor_version=1,
+        domain=DOMAIN,
+        title=f"user{number}",
+        data={
+            "userid": f"user{number}",
+            "api_key": f"key{number % keys}",
+            "name": f"User {number}",
+        },
+        source="user",
+        options={},
+    )
+
+
+async def async_run(args: argparse.Namespace) -> int:
+    """Run the load test and print the report."""
+    fake, runner, base_url = await async_start(config_from_args(args))
+
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        hass.data[DOMAIN] = {
+            DATA_SCHEDULERS: {
+                f"key{key}": RequestScheduler(hass, args.rate, args.daily_limit)
+                for key in range(args.keys)
+            }
+        }
+        session = async_get_clientsession(hass)
+        retry_policy = RetryPolicy(base_delay=args.retry_base, max_delay=args.retry_max)
+
+        if args.trace_memory:
+            tracemalloc.start()
+        coordinators = []
+        for number in range(args.entries):
+            coordinator = SetlistFmCoordinator(hass, _make_entry(number, args.keys))
+            coordinator.client = SetlistFmClient(
+                session,
+                coordinator.api_key,
+                coordinator.scheduler,
+                retry_policy,
+                base_url=base_url,
+                metrics=coordinator.client.metrics,
+            )
+            coordinators.append(coordinator)
+
+        print(
+            f"{args.entries} entries on {args.keys} key(s), {args.shows} shows each"
+            f" ({len(fake.pages)} pages), scheduler rate {args.rate}/s per key"
+        )
+        for round_number in range(1, args.rounds + 1):
+            served = sum(fake.requests.values())
+            started = perf_counter()
+            await asyncio.gather(
+                *(coordinator.async_refresh() for coordinator in coordinators)
+            )
+            elapsed = perf_counter() - started
+            failed = sum(
+                not coordinator.last_update_success for coordinator in coordinators
+            )
+            print(
+                f"round {round_number}: {elapsed:.2f} s,"
+                f" {sum(fake.requests.values()) - served} requests,"
+                f" {failed} failed refresh(es)"
+            )
+
+        if args.trace_memory:
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+        print("requests by endpoint and status:")
+        for (endpoint, status), count in sorted(fake.requests.items()):
+            print(f"  {endpoint:<9} {status}  {count}")
+        retries = sum(c.client.metrics.retries for c in coordinators)
+        print(f"client retries: {retries}")
+        if args.trace_memory:
+            print(f"peak traced memory: {peak / 1_000_000:.1f} MB")
+        print(
+            "peak RSS (process): "
+            f"{resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1000:.1f} MB"
+        )
+
+        for coordinator in coordinators:
+            await coordinator.async_shutdown()
+        await hass.async_stop(force=True)
+
+    await runner.cleanup()
+    return 0
+
+
+def main() -> int:
+    """Parse arguments and run."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--entries", type=int, default=10, help="config entries")
+    parser.add_argument("--keys", type=int, default=1, help="distinct API keys")
+    parser.add_argument("--rounds", type=int, default=2, help="refresh rounds")
+    parser.add_argument(
+        "--rate", type=float, default=1000, help="scheduler requests/second per key"
+    )
+    parser.add_argument(
+        "--daily-limit", type=int, default=10**9, help="scheduler requests/day per key"
+    )
+    parser.add_argument("--retry-base", type=float, default=0.1)
+    parser.add_argument("--retry-max", type=float, default=2.0)
+    parser.add_argument(
+        "--trace-memory",
+        action="store_true",
+        help="also report tracemalloc's peak (slows the run down several times)",
+    )
+    add_arguments(parser)
+    return asyncio.run(async_run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,104 @@
+"""Synthetic setlist.fm payloads for the benchmarks.
+
+The generated setlists have the shape of ``/user/{id}/attended`` items. The
+distributions are loosely realistic: a few artists and venues account for
+most shows, setlists have 10-25 songs, and a handful of shows are in the
+future. The generator is seeded, so every run sees the same payloads.
+"""
+from __future__ import annotations
+
+from datetime import date, timedelta
+import random
+from typing import Any
+
+ITEMS_PER_PAGE = 20
+
+_COUNTRIES = [
+    ("United Kingdom", "GB"),
+    ("United States", "US"),
+    ("Germany", "DE"),
+    ("Netherlands", "NL"),
+    ("France", "FR"),
+    ("Spain", "ES"),
+    ("Japan", "JP"),
+    ("Australia", "AU"),
+]
+
+
+def generate_setlists(count: int, seed: int = 1) -> list[dict[str, Any]]:
+    """Return ``count`` attended setlists, newest first."""
+    rng = random.Random(seed)
+    artists = max(5, count // 8)
+    venues = max(3, count // 5)
+    songs_per_artist = 60
+    today = date.today()
+
+    setlists = []
+    for number in range(count):
+        # A few upcoming shows, the rest spread over the past 40 years
+        if number < 5:
+            show_date = today + timedelta(days=7 * (5 - number))
+        else:
+            show_date = today - timedelta(days=1 + number * 14600 // count)
+        artist = min(int(rng.paretovariate(1.2)) - 1, artists - 1)
+        venue = min(int(rng.paretovariate(1.1)) - 1, venues - 1)
+        country, code = _COUNTRIES[venue % len(_COUNTRIES)]
+        songs = rng.sample(range(songs_per_artist), rng.randint(10, 25))
+
+        setlists.append(
+            {
+                "id": f"{number:08x}",
+                "versionId": f"v{number:07x}",
+                "eventDate": show_date.strftime("%d-%m-%Y"),
+                "lastUpdated": "2024-01-01T00:00:00.000+0000",
+                "artist": {
+                    "mbid": f"00000000-0000-0000-0000-{artist:012d}",
+                    "name": f"Artist {artist}",
+                    "sortName": f"Artist {artist}",
+                    "disambiguation": "",
+                    "url": f"https://www.setlist.fm/setlists/artist-{artist}.html",
+                },
+                "venue": {
+                    "id": f"venue{venue}",
+                    "name": f"Venue {venue}",
+                    "city": {
+                        "id": f"city{venue % 97}",
+                        "name": f"City {venue % 97}",
+                        "state": "",
+                        "stateCode": "",
+                        "coords": {"lat": 51.5, "long": -0.1},
+                        "country": {"code": code, "name": country},
+                    },
+                    "url": f"https://www.setlist.fm/venue/venue-{venue}.html",
+                },
+                "tour": {"name": f"Tour {artist}-{number % 4}"},
+                "sets": {
+                    "set": [
+                        {
+                            "song": [
+                                {"name": f"Song {artist}-{song}", "info": ""}
+                                for song in songs
+                            ]
+                        }
+                    ]
+                },
+                "url": f"https://www.setlist.fm/setlist/{number:08x}.html",
+            }
+        )
+
+    # Already newest first: dates only ever move back as number grows
+    return setlists
+
+
+def paginate(setlists: list[dict[str, Any]], page: int) -> dict[str, Any] | None:
+    """Return one attended page as setlist.fm does, or None past the end."""
+    items = setlists[(page - 1) * ITEMS_PER_PAGE : page * ITEMS_PER_PAGE]
+    if not items:
+        return None
+    return {
+        "type": "setlists",
+        "itemsPerPage": ITEMS_PER_PAGE,
+        "page": page,
+        "total": len(setlists),
+        "setlist": items,
+    }
@@ -3,20 +3,261 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from datetime import timedelta
+from datetime import datetime, timedelta
+from pathlib import Path
+from time import monotonic
+from typing import Any
+
+import voluptuous as vol
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
+from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.event import async_track_time_change
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
-from homeassistant.exceptions import ConfigEntryAuthFailed
-
-from .const import DOMAIN, CONF_USERID, CONF_API_KEY
+from homeassistant.exceptions import (
+    ConfigEntryAuthFailed,
+    HomeAssistantError,
+    ServiceValidationError,
+)
+from homeassistant.util import dt as dt_util
+
+from .api import (
+    SetlistFmClient,
+    SetlistFmError,
+    SetlistFmAuthError,
+    SetlistFmNotFoundError,
+)
+from .const import (
+    DOMAIN,
+    CONF_USERID,
+    CONF_API_KEY,
+    SERVICE_REFRESH,
+    SERVICE_GET_CONCERTS,
+    SERVICE_SEARCH_SONGS,
+    SERVICE_EXPORT,
+    ATTR_ENTRY_ID,
+    ATTR_QUERY,
+    ATTR_MATCH,
+    ATTR_ARTIST,
+    ATTR_LIMIT,
+    MATCH_EXACT,
+    MATCH_PREFIX,
+    DEFAULT_SEARCH_LIMIT,
+    EXPORT_FORMATS,
+    DEFAULT_EXPORT_FORMAT,
+    EXPORT_DIR,
+    ATTR_START_DATE,
+    ATTR_END_DATE,
+    ATTR_VENUE,
+    ATTR_COUNTRY,
+    ATTR_SHOW,
+    ATTR_SORT,
+    ATTR_CURSOR,
+    ATTR_FORMAT,
+    ATTR_INCREMENTAL,
+    SHOW_CONCERTS_OPTIONS,
+    SORT_OPTIONS,
+    DEFAULT_SHOW_CONCERTS,
+    DEFAULT_SORT,
+    DEFAULT_PAGE_SIZE,
+    MAX_PAGE_SIZE,
+    CONF_REFRESH_PERIOD,
+    CONF_ADAPTIVE_REFRESH,
+    CONF_MAX_REFRESH_PERIOD,
+    CONF_WATCHED_ARTISTS,
+    DEFAULT_REFRESH_PERIOD,
+    DEFAULT_ADAPTIVE_REFRESH,
+    DEFAULT_MAX_REFRESH_PERIOD,
+    DEFAULT_WATCHED_ARTISTS,
+    SETLIST_PUBLISH_WINDOW,
+    SIGNAL_METRICS_UPDATED,
+    USER_PROFILE_TTL,
+)
+from .entity import entry_name
+from .export import export_concerts
+from .household import Household
+from .models import Concert, ConcertIndex
+from .scheduler import PRIORITY_POLL, PRIORITY_USER, RequestScheduler
+from .store import SetlistCache
+from .sync import AttendedHistory
+from .watchlist import ArtistCache, ArtistSetlists, parse_watchlist
 
 _LOGGER = logging.getLogger(__name__)
 
-PLATFORMS: list[Platform] = [Platform.SENSOR]
+PLATFORMS: list[Platform] = [Platform.CALENDAR, Platform.SENSOR]
+
+REFRESH_SCHEMA = vol.Schema({vol.Optional(ATTR_ENTRY_ID): cv.string})
+
+GET_CONCERTS_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_ENTRY_ID): cv.string,
+        vol.Optional(ATTR_START_DATE): cv.date,
+        vol.Optional(ATTR_END_DATE): cv.date,
+        vol.Optional(ATTR_ARTIST): cv.string,
+        vol.Optional(ATTR_VENUE): cv.string,
+        vol.Optional(ATTR_COUNTRY): cv.string,
+        vol.Optional(ATTR_SHOW, default=DEFAULT_SHOW_CONCERTS): vol.In(
+            list(SHOW_CONCERTS_OPTIONS)
+        ),
+        vol.Optional(ATTR_SORT, default=DEFAULT_SORT): vol.In(SORT_OPTIONS),
+        vol.Optional(ATTR_LIMIT, default=DEFAULT_PAGE_SIZE): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=MAX_PAGE_SIZE)
+        ),
+        vol.Optional(ATTR_CURSOR): cv.string,
+    }
+)
+
+SEARCH_SONGS_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_ENTRY_ID): cv.string,
+        vol.Required(ATTR_QUERY): vol.All(cv.string, vol.Length(min=1)),
+        vol.Optional(ATTR_MATCH, default=MATCH_PREFIX): vol.In(
+            [MATCH_EXACT, MATCH_PREFIX]
+        ),
+        vol.Optional(ATTR_ARTIST): cv.string,
+        vol.Optional(ATTR_LIMIT, default=DEFAULT_SEARCH_LIMIT): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=500)
+        ),
+    }
+)
+
+EXPORT_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_ENTRY_ID): cv.string,
+        vol.Optional(ATTR_FORMAT, default=DEFAULT_EXPORT_FORMAT): vol.In(
+            EXPORT_FORMATS
+        ),
+        vol.Optional(ATTR_INCREMENTAL, default=False): cv.boolean,
+    }
+)
+
+# Entries refreshed at the same time by setlistfm.refresh
+REFRESH_CONCURRENCY = 4
+
+# hass.data[DOMAIN] key holding the request schedulers, keyed by API key. They
+# are kept for the life of hass, so reloading an entry keeps the daily budget,
+# any Retry-After pause and the circuit breaker state of its key
+DATA_SCHEDULERS = "schedulers"
+
+
+# hass.data[DOMAIN] key holding the watched artists' setlists, shared by all entries
+DATA_ARTISTS = "artists"
+
+# hass.data[DOMAIN] key holding the combined history of all entries
+DATA_HOUSEHOLD = "household"
+
+# hass.data[DOMAIN] key holding what the config flow fetched while validating
+# a new entry, keyed by user ID, for the entry's setup to start from
+DATA_SEEDS = "seeds"
+
+
+def async_get_scheduler(hass: HomeAssistant, api_key: str) -> RequestScheduler:
+    """Return the request scheduler shared by all entries using an API key."""
+    schedulers = hass.data.setdefault(DOMAIN, {}).setdefault(DATA_SCHEDULERS, {})
+    if api_key not in schedulers:
+        schedulers[api_key] = RequestScheduler(hass)
+    return schedulers[api_key]
+
+
+def _async_get_artist_cache(hass: HomeAssistant) -> ArtistCache:
+    """Return the watched artists cache shared by all entries."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if DATA_ARTISTS not in domain_data:
+        domain_data[DATA_ARTISTS] = ArtistCache(hass)
+    return domain_data[DATA_ARTISTS]
+
+
+def async_get_household(hass: HomeAssistant) -> Household:
+    """Return the combined history of all entries."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if DATA_HOUSEHOLD not in domain_data:
+        domain_data[DATA_HOUSEHOLD] = Household(hass)
+    return domain_data[DATA_HOUSEHOLD]
+
+
+def _async_get_coordinator(
+    hass: HomeAssistant, entry_id: str
+) -> SetlistFmCoordinator:
+    """Return the coordinator of a loaded entry, for service calls."""
+    coord = hass.data.get(DOMAIN, {}).get(entry_id)
+    if not isinstance(coord, SetlistFmCoordinator):
+        raise ServiceValidationError(f"No loaded setlist.fm entry with ID {entry_id}")
+    return coord
+
+
+def _query_concerts(index: ConcertIndex, query: dict[str, Any]) -> list[Concert]:
+    """Filter and sort the concerts of an index for setlistfm.get_concerts.
+
+    The date range (including past/upcoming) is a binary search over the
+    date-sorted index; only the concerts inside it are checked against the
+    text filters.
+    """
+    start = query.get(ATTR_START_DATE)
+    end = query.get(ATTR_END_DATE)
+    today = dt_util.now().date()
+    if query[ATTR_SHOW] == "upcoming":
+        start = max(start, today) if start else today
+    elif query[ATTR_SHOW] == "past":
+        yesterday = today - timedelta(days=1)
+        end = min(end, yesterday) if end else yesterday
+
+    concerts = index.between(start, end)
+
+    if artist := query.get(ATTR_ARTIST):
+        artist = artist.casefold()
+        concerts = [
+            concert
+            for concert in concerts
+            if artist in (concert.artist.name or "").casefold()
+        ]
+    if venue := query.get(ATTR_VENUE):
+        venue = venue.casefold()
+        concerts = [
+            concert
+            for concert in concerts
+            if venue in (concert.venue.name or "").casefold()
+        ]
+    if country := query.get(ATTR_COUNTRY):
+        country = country.casefold()
+        concerts = [
+            concert
+            for concert in concerts
+            if country
+            in (concert.venue.country.casefold(), concert.venue.country_code.casefold())
+        ]
+
+    sort = query[ATTR_SORT]
+    if sort == "date_asc":
+        concerts = concerts[::-1]
+    elif sort == "artist":
+        # Stable sort, so each artist's shows stay newest first
+        concerts = sorted(
+            concerts, key=lambda concert: (concert.artist.name or "").casefold()
+        )
+    elif sort == "venue":
+        concerts = sorted(
+            concerts, key=lambda concert: (concert.venue.name or "").casefold()
+        )
+    return concerts
+
+
+def _async_coordinators(hass: HomeAssistant) -> list[SetlistFmCoordinator]:
+    """Return the coordinators of all loaded entries."""
+    return [
+        coord
+        for coord in hass.data.get(DOMAIN, {}).values()
+        if isinstance(coord, SetlistFmCoordinator)
+    ]
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
@@ -24,29 +265,172 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     hass.data.setdefault(DOMAIN, {})
 
     coordinator = SetlistFmCoordinator(hass, entry)
-    await coordinator.async_config_entry_first_refresh()
+    seed = hass.data[DOMAIN].get(DATA_SEEDS, {}).pop(entry.data[CONF_USERID], None)
+    if seed is not None:
+        # Just added: start from what the config flow fetched
+        has_data = True
+        up_to_date = coordinator.async_seed(*seed)
+    else:
+        has_data = await coordinator.async_restore_cache()
+        up_to_date = False
+
+    if not has_data:
+        await coordinator.async_config_entry_first_refresh()
+    elif not up_to_date:
+        # Entities come up with cached data; fetch fresh data without blocking startup
+        entry.async_create_background_task(
+            hass, coordinator.async_refresh(), f"{DOMAIN}_{entry.entry_id}_refresh"
+        )
 
     hass.data[DOMAIN][entry.entry_id] = coordinator
+    entry.async_on_unload(
+        async_get_household(hass).async_add_member(
+            entry.entry_id,
+            entry_name(entry),
+            coordinator,
+        )
+    )
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
+    # Shows move from upcoming to past at local midnight, whether or not a poll is due
+    entry.async_on_unload(
+        async_track_time_change(
+            hass, coordinator.async_date_rolled_over, hour=0, minute=0, second=0
+        )
+    )
+
     # Register update listener for options changes
     entry.async_on_unload(entry.add_update_listener(update_listener))
 
-    # Register a single shared refresh service, guarded against double-registration
-    if not hass.services.has_service(DOMAIN, "refresh"):
-        async def handle_refresh(call) -> None:
-            """Force refresh of data for a config entry."""
-            entry_id = call.data.get("entry_id")
-            if entry_id and entry_id in hass.data[DOMAIN]:
-                await hass.data[DOMAIN][entry_id].async_request_refresh()
+    # Register the shared services once, guarded against double-registration
+    if not hass.services.has_service(DOMAIN, SERVICE_REFRESH):
+        async def handle_refresh(call: ServiceCall) -> ServiceResponse:
+            """Force refresh of data for one or all config entries."""
+            if entry_id := call.data.get(ATTR_ENTRY_ID):
+                coordinators = [_async_get_coordinator(hass, entry_id)]
             else:
                 # Refresh all entries if no specific entry_id given
-                for coord in hass.data[DOMAIN].values():
-                    if isinstance(coord, SetlistFmCoordinator):
-                        await coord.async_request_refresh()
+                coordinators = _async_coordinators(hass)
+
+            semaphore = asyncio.Semaphore(REFRESH_CONCURRENCY)
+
+            async def _async_refresh(coord: SetlistFmCoordinator) -> tuple[str, dict]:
+                async with semaphore:
+                    started = monotonic()
+                    await coord.async_user_refresh()
+                    result = {
+                        "success": coord.last_update_success,
+                        "duration": round(monotonic() - started, 3),
+                    }
+                if coord.last_exception and not coord.last_update_success:
+                    result["error"] = str(coord.last_exception)
+                return coord.entry.entry_id, result
+
+            results = await asyncio.gather(
+                *(_async_refresh(coord) for coord in coordinators)
+            )
+            if not call.return_response:
+                return None
+            return {"entries": dict(results)}
+
+        hass.services.async_register(
+            DOMAIN,
+            SERVICE_REFRESH,
+            handle_refresh,
+            schema=REFRESH_SCHEMA,
+            supports_response=SupportsResponse.OPTIONAL,
+        )
 
-        hass.services.async_register(DOMAIN, "refresh", handle_refresh)
+    if not hass.services.has_service(DOMAIN, SERVICE_GET_CONCERTS):
+        async def handle_get_concerts(call: ServiceCall) -> ServiceResponse:
+            """Return one page of the filtered concerts of a config entry."""
+            coord = _async_get_coordinator(hass, call.data[ATTR_ENTRY_ID])
+            cursor = call.data.get(ATTR_CURSOR)
+            if cursor is None:
+                offset = 0
+            elif cursor.isdigit():
+                offset = int(cursor)
+            else:
+                raise ServiceValidationError(f"Invalid cursor: {cursor}")
+
+            if coord.data is None:
+                return {"count": 0, "concerts": [], "next_cursor": None}
+            concerts = _query_concerts(coord.data["index"], call.data)
+            end = offset + call.data[ATTR_LIMIT]
+            return {
+                "count": len(concerts),
+                "concerts": [concert.as_dict() for concert in concerts[offset:end]],
+                "next_cursor": str(end) if end < len(concerts) else None,
+            }
+
+        hass.services.async_register(
+            DOMAIN,
+            SERVICE_GET_CONCERTS,
+            handle_get_concerts,
+            schema=GET_CONCERTS_SCHEMA,
+            supports_response=SupportsResponse.ONLY,
+        )
+
+    if not hass.services.has_service(DOMAIN, SERVICE_SEARCH_SONGS):
+        async def handle_search_songs(call: ServiceCall) -> ServiceResponse:
+            """Look up songs heard at the attended shows of a config entry."""
+            coord = _async_get_coordinator(hass, call.data[ATTR_ENTRY_ID])
+            songs = coord.history.songs.search(
+                call.data[ATTR_QUERY],
+                prefix=call.data[ATTR_MATCH] == MATCH_PREFIX,
+                artist=call.data.get(ATTR_ARTIST),
+                limit=call.data[ATTR_LIMIT],
+            )
+            return {"count": len(songs), "songs": songs}
+
+        hass.services.async_register(
+            DOMAIN,
+            SERVICE_SEARCH_SONGS,
+            handle_search_songs,
+            schema=SEARCH_SONGS_SCHEMA,
+            supports_response=SupportsResponse.ONLY,
+        )
+
+    if not hass.services.has_service(DOMAIN, SERVICE_EXPORT):
+        async def handle_export(call: ServiceCall) -> ServiceResponse:
+            """Write the full history of a config entry to a file."""
+            coord = _async_get_coordinator(hass, call.data[ATTR_ENTRY_ID])
+            if coord.data is None:
+                raise ServiceValidationError(
+                    f"No concerts synced yet for {coord.userid}"
+                )
+            export_format = call.data[ATTR_FORMAT]
+            path = Path(
+                hass.config.path(EXPORT_DIR, f"{coord.userid}.{export_format}")
+            )
+            # The index's list is replaced on changes, never modified, so the
+            # executor can read it while new data arrives
+            concerts = coord.data["index"].concerts
+            async with coord.export_lock:
+                try:
+                    exported = await hass.async_add_executor_job(
+                        export_concerts,
+                        path,
+                        concerts,
+                        export_format,
+                        call.data[ATTR_INCREMENTAL],
+                    )
+                except ValueError as err:
+                    raise ServiceValidationError(
+                        f"{err}; move the file away or export without incremental"
+                    ) from err
+                except OSError as err:
+                    raise HomeAssistantError(f"Error writing {path}: {err}") from err
+            return {"path": str(path), "exported": exported, "total": len(concerts)}
+
+        hass.services.async_register(
+            DOMAIN,
+            SERVICE_EXPORT,
+            handle_export,
+            schema=EXPORT_SCHEMA,
+            supports_response=SupportsResponse.OPTIONAL,
+        )
 
     return True
 
@@ -57,13 +441,26 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     if unload_ok:
         hass.data[DOMAIN].pop(entry.entry_id)
-        # Remove the shared service only when the last entry is unloaded
-        if not hass.data[DOMAIN]:
-            hass.services.async_remove(DOMAIN, "refresh")
+        coordinators = _async_coordinators(hass)
+        if artists := hass.data[DOMAIN].get(DATA_ARTISTS):
+            artists.prune(
+                {mbid for coord in coordinators for mbid in coord.watchlist}
+            )
+        # Remove the shared services only when the last entry is unloaded
+        if not coordinators:
+            hass.services.async_remove(DOMAIN, SERVICE_REFRESH)
+            hass.services.async_remove(DOMAIN, SERVICE_GET_CONCERTS)
+            hass.services.async_remove(DOMAIN, SERVICE_SEARCH_SONGS)
+            hass.services.async_remove(DOMAIN, SERVICE_EXPORT)
 
     return unload_ok
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the on-disk cache when a config entry is deleted."""
+    await SetlistCache(hass, entry.entry_id).async_remove()
+
+
 async def update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Handle options update."""
     await hass.config_entries.async_reload(entry.entry_id)
@@ -78,88 +475,286 @@ class SetlistFmCoordinator(DataUpdateCoordinator):
         self.userid = entry.data[CONF_USERID]
         self.api_key = entry.data[CONF_API_KEY]
 
-        refresh_hours = entry.options.get("refresh_period", 6)
+        self.scheduler = async_get_scheduler(hass, self.api_key)
+        # Use HA-managed session — properly closed on unload, uses HA's SSL context
+        self.client = SetlistFmClient(
+            async_get_clientsession(hass),
+            self.api_key,
+            self.scheduler,
+        )
+        # Song names are kept for the song index behind setlistfm.search_songs
+        self.history = AttendedHistory(keep_songs=True)
+        self.cache = SetlistCache(hass, entry.entry_id)
+        # When data was last fetched successfully, not just pushed to entities
+        self.last_fetched: datetime | None = None
+        # The update in flight, joined by scheduled and manual refreshes alike
+        self._update_task: asyncio.Task | None = None
+        self._user_data: dict = {}
+        self._user_fetched_at: datetime | None = None
+        # Keeps exports of this entry from writing the same file at once
+        self.export_lock = asyncio.Lock()
+
+        options = entry.options
+        self._min_interval = timedelta(
+            hours=options.get(CONF_REFRESH_PERIOD, DEFAULT_REFRESH_PERIOD)
+        )
+        self._max_interval = max(
+            self._min_interval,
+            timedelta(
+                hours=options.get(CONF_MAX_REFRESH_PERIOD, DEFAULT_MAX_REFRESH_PERIOD)
+            ),
+        )
+        self._adaptive = options.get(CONF_ADAPTIVE_REFRESH, DEFAULT_ADAPTIVE_REFRESH)
+        self.watchlist = parse_watchlist(
+            options.get(CONF_WATCHED_ARTISTS, DEFAULT_WATCHED_ARTISTS)
+        )
+        self.artists = _async_get_artist_cache(hass)
 
         super().__init__(
             hass,
             _LOGGER,
             name=f"{DOMAIN}_{self.userid}",
-            update_interval=timedelta(hours=refresh_hours),
+            update_interval=self._min_interval,
+            # Returning the previous data object skips the listener updates
+            always_update=False,
         )
 
-    async def _async_update_data(self):
-        """Fetch data from API."""
-        headers = {
-            "x-api-key": self.api_key,
-            "Accept": "application/json",
-        }
-
-        # Use HA-managed session — properly closed on unload, uses HA's SSL context
-        session = async_get_clientsession(self.hass)
-
-        # Fetch user data
-        user_url = f"https://api.setlist.fm/rest/1.0/user/{self.userid}"
+    async def async_restore_cache(self) -> bool:
+        """Populate the coordinator from the on-disk cache, if there is one."""
+        cached = await self.cache.async_load()
+        if cached is None:
+            return False
+
+        self._user_data, concerts, fetched = cached
+        self.history.restore(concerts)
+        if fetched is not None:
+            # Show the age of the cached data until a fetch succeeds
+            self.last_fetched = dt_util.as_local(fetched)
+            self.client.metrics.last_success = dt_util.as_utc(fetched)
+        self.async_set_updated_data(self._build_data(self._user_data))
+        _LOGGER.debug(
+            "Restored %d cached concerts for %s", len(concerts), self.userid
+        )
+        return True
+
+    @callback
+    def async_seed(self, user_data: dict, attended_page: dict) -> bool:
+        """Start from the profile and first attended page fetched by the config flow.
+
+        Returns True if that page held the whole history, so no refresh is
+        needed until the next scheduled one.
+        """
+        self._user_data = user_data
+        self._user_fetched_at = dt_util.utcnow()
+        self.last_fetched = dt_util.now()
+        complete = self.history.seed(attended_page)
+        self.async_set_updated_data(self._build_data(self._user_data))
+        self.cache.async_schedule_save(
+            self._user_data, self.history.concerts, self.last_fetched
+        )
+        return complete
+
+    @callback
+    def async_date_rolled_over(self, now: datetime) -> None:
+        """Re-partition past and upcoming shows for the new day, without polling."""
+        if self.data is None:
+            return
+        today = dt_util.as_local(now).date()
+        self.data["index"].upcoming(today)
+        self.artists.roll_over(today)
+        self.async_update_listeners()
+
+    async def async_user_refresh(self) -> None:
+        """Refresh now, with API calls ahead of background polls.
+
+        Like any refresh, this joins an update that is already running
+        instead of starting another one.
+        """
+        self._async_start_update(PRIORITY_USER)
+        await self.async_refresh()
+
+    @callback
+    def _async_start_update(self, priority: int) -> asyncio.Task:
+        """Return the update in flight, starting one at this priority if none is."""
+        if self._update_task is None or self._update_task.done():
+            self._update_task = self.hass.async_create_task(
+                self._async_update(priority)
+            )
+        return self._update_task
 
+    async def _async_update_data(self):
+        """Run or join the update in flight."""
+        # Shielded so a cancelled caller doesn't cancel the shared update
+        return await asyncio.shield(self._async_start_update(PRIORITY_POLL))
+
+    async def _async_update(self, priority: int) -> dict:
+        """Fetch data from API, recording how the attempt went."""
+        metrics = self.client.metrics
+        started = monotonic()
         try:
-            async with session.get(user_url, headers=headers) as response:
-                if response.status == 401:
-                    raise ConfigEntryAuthFailed("Invalid API key")
-                elif response.status == 404:
-                    raise UpdateFailed(f"User {self.userid} not found")
-                elif response.status != 200:
-                    raise UpdateFailed(
-                        f"Error fetching user data: {response.status}"
-                    )
-                user_data = await response.json()
-
-        except ConfigEntryAuthFailed:
+            data = await self._async_fetch(priority)
+        except Exception:
+            # Whatever was fetched was not applied; don't treat it as unchanged
+            self.client.invalidate()
+            metrics.record_sync(monotonic() - started, success=False)
+            self._async_metrics_updated()
+            if self._adaptive:
+                # Retry at the refresh period, not a week out
+                self.update_interval = self._min_interval
             raise
-        except Exception as err:
-            raise UpdateFailed(f"Error connecting to setlist.fm: {err}") from err
-
-        # Fetch attended concerts with retry logic for rate limiting
-        attended_url = f"https://api.setlist.fm/rest/1.0/user/{self.userid}/attended"
-
-        # Initialise before the loop so the variable is always bound
-        concerts_data: dict = {}
-
-        for attempt in range(3):
-            try:
-                async with session.get(attended_url, headers=headers) as response:
-                    if response.status == 200:
-                        concerts_data = await response.json()
-                        break
-                    elif response.status == 429:
-                        if attempt < 2:
-                            _LOGGER.warning(
-                                "Rate limit exceeded, retrying in 5 seconds (attempt %d/3)",
-                                attempt + 1,
-                            )
-                            await asyncio.sleep(5)
-                            continue
-                        else:
-                            raise UpdateFailed("Rate limit exceeded after 3 attempts")
-                    elif response.status == 401:
-                        raise ConfigEntryAuthFailed("Invalid API key")
-                    else:
-                        raise UpdateFailed(
-                            f"Error fetching concerts: {response.status}"
-                        )
-
-            except (ConfigEntryAuthFailed, UpdateFailed):
-                raise
-            except Exception as err:
-                if attempt < 2:
-                    _LOGGER.warning(
-                        "Connection error, retrying (attempt %d/3): %s",
-                        attempt + 1,
-                        err,
-                    )
-                    await asyncio.sleep(5)
-                    continue
-                raise UpdateFailed(f"Error connecting to setlist.fm: {err}") from err
+        self.last_fetched = dt_util.now()
+        metrics.record_sync(
+            monotonic() - started,
+            success=True,
+            normalize_time=self.history.normalize_time,
+        )
+        self._async_metrics_updated()
+        return data
+
+    @callback
+    def _async_metrics_updated(self) -> None:
+        """Let diagnostic sensors follow every attempt, changed data or not."""
+        async_dispatcher_send(
+            self.hass, SIGNAL_METRICS_UPDATED.format(self.entry.entry_id)
+        )
 
+    async def _async_fetch(self, priority: int) -> dict:
+        """Fetch what changed and build new data, or return the current data."""
+        # The profile, the attended history and the watchlist are independent;
+        # fetch them together
+        history_changed, user_data, watchlist_result = await asyncio.gather(
+            self.history.async_sync(self.client, self.userid, priority),
+            self._async_fetch_user(priority),
+            self.artists.async_refresh(self.client, self.watchlist, priority),
+            return_exceptions=True,
+        )
+
+        if isinstance(history_changed, SetlistFmNotFoundError) and not isinstance(
+            user_data, BaseException
+        ):
+            # Page 1 of a known history answered 404. If the user still
+            # exists, they cleared their attended list
+            if user_data is None:
+                self._user_fetched_at = None
+                try:
+                    user_data = await self._async_fetch_user(priority)
+                except SetlistFmError as err:
+                    user_data = err
+            if not isinstance(user_data, BaseException):
+                _LOGGER.info("Attended history of %s is now empty", self.userid)
+                history_changed = self.history.clear()
+
+        for result in (user_data, history_changed):
+            if isinstance(result, (SetlistFmAuthError, SetlistFmNotFoundError)):
+                # Re-check the profile once the key or user works again
+                self._user_fetched_at = None
+            if isinstance(result, SetlistFmAuthError):
+                raise ConfigEntryAuthFailed("Invalid API key") from result
+        if isinstance(user_data, SetlistFmNotFoundError):
+            raise UpdateFailed(f"User {self.userid} not found") from user_data
+        if isinstance(user_data, SetlistFmError):
+            raise UpdateFailed(f"Error fetching user data: {user_data}") from user_data
+        if isinstance(history_changed, SetlistFmError):
+            raise UpdateFailed(
+                f"Error fetching concerts: {history_changed}"
+            ) from history_changed
+        for result in (user_data, history_changed, watchlist_result):
+            if isinstance(result, BaseException):
+                raise result
+
+        if (
+            user_data is None
+            and not history_changed
+            and self.data is not None
+            # Compared by identity; also picks up artists refreshed by other entries
+            and self._watched_artists() == self.data["watchlist"]
+        ):
+            _LOGGER.debug("No changes for %s, keeping current data", self.userid)
+            if self._adaptive:
+                # Time has moved on even if the data has not
+                self.update_interval = self._adaptive_interval(self.data["index"])
+            return self.data
+
+        self.cache.async_schedule_save(
+            self._user_data, self.history.concerts, dt_util.now()
+        )
+
+        return self._build_data(self._user_data)
+
+    async def _async_fetch_user(self, priority: int) -> dict | None:
+        """Fetch the user profile if it is due, returning None if not fetched.
+
+        The profile rarely changes and is barely used, so it is only fetched
+        when it is older than USER_PROFILE_TTL, after the API rejected the key
+        or user, or on a manual refresh. None is also returned when the
+        profile is unchanged since the last fetch.
+        """
+        if (
+            priority != PRIORITY_USER
+            and self._user_fetched_at is not None
+            and dt_util.utcnow() - self._user_fetched_at < USER_PROFILE_TTL
+        ):
+            return None
+
+        user_data = await self.client.async_get_user(
+            self.userid, priority, conditional=bool(self._user_data)
+        )
+        self._user_fetched_at = dt_util.utcnow()
+        if user_data is not None:
+            self._user_data = user_data
+        return user_data
+
+    def _build_data(self, user_data: dict) -> dict:
+        """Assemble coordinator data, normalizing the history once per update."""
+        index = ConcertIndex.from_concerts(self.history.concerts)
+        if self._adaptive:
+            self.update_interval = self._adaptive_interval(index)
         return {
             "user": user_data,
-            "concerts": concerts_data.get("setlist", []),
+            "index": index,
+            # Maintained by the history as setlists arrive, never recounted here
+            "stats": self.history.stats,
+            "watchlist": self._watched_artists(),
         }
+
+    def _watched_artists(self) -> list[ArtistSetlists]:
+        """Return the cached setlists of the watched artists, in watchlist order."""
+        return [
+            artist
+            for mbid in self.watchlist
+            if (artist := self.artists.get(mbid)) is not None
+        ]
+
+    def _adaptive_interval(self, index: ConcertIndex) -> timedelta:
+        """Pick the next poll interval from the dates of the user's shows.
+
+        Setlists are published on the day of a show and the few days after, so
+        poll at the minimum interval then. Otherwise sleep until the day of the
+        next upcoming show, but never longer than the maximum interval, nor
+        past the time the next watched artist is due for a refresh.
+        """
+        now = dt_util.now()
+        today = now.date()
+        upcoming = index.upcoming(today)
+        past = index.past(today)
+
+        show_today = bool(upcoming) and upcoming[-1].date == today
+        recent_show = (
+            bool(past) and (today - past[0].date).days <= SETLIST_PUBLISH_WINDOW
+        )
+
+        if show_today or recent_show:
+            interval = self._min_interval
+        elif upcoming:
+            next_show = dt_util.start_of_local_day(upcoming[-1].date)
+            interval = min(self._max_interval, next_show - now)
+        else:
+            interval = self._max_interval
+
+        # Watched artists are only refreshed by polls
+        if (artist_due := self.artists.next_due(self.watchlist)) is not None:
+            interval = min(interval, artist_due - now)
+
+        interval = max(self._min_interval, min(self._max_interval, interval))
+        _LOGGER.debug("Next setlist.fm poll for %s in %s", self.userid, interval)
+        return interval
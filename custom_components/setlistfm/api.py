@@ -0,0 +1,296 @@
+"""Client for the setlist.fm REST API."""
+from __future__ import annotations
+
+import asyncio
+from email.utils import parsedate_to_datetime
+import hashlib
+import logging
+import random
+from time import monotonic
+from typing import Any, NamedTuple
+
+import aiohttp
+from aiohttp import hdrs
+
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.util import dt as dt_util
+from homeassistant.util.json import json_loads
+
+from .metrics import FetchMetrics
+from .scheduler import PRIORITY_POLL, PRIORITY_USER, RequestScheduler
+
+_LOGGER = logging.getLogger(__name__)
+
+API_BASE_URL = "https://api.setlist.fm/rest/1.0"
+
+# Transient server errors worth retrying, in addition to 429
+RETRY_STATUSES = {500, 502, 503, 504}
+
+
+class _Validators(NamedTuple):
+    """What we know about the last response to a conditional request."""
+
+    etag: str | None
+    last_modified: str | None
+    digest: bytes
+
+
+class SetlistFmClient:
+    """Thin wrapper around the setlist.fm endpoints used by this integration.
+
+    Conditional requests return None when the resource is unchanged since
+    the previous conditional request for it: either setlist.fm answered 304
+    to our validator headers, or the body is byte-identical (in which case
+    it is not decoded).
+    """
+
+    def __init__(
+        self,
+        session: aiohttp.ClientSession,
+        api_key: str,
+        scheduler: RequestScheduler,
+        retry_policy: RetryPolicy | None = None,
+        base_url: str = API_BASE_URL,
+        metrics: FetchMetrics | None = None,
+    ) -> None:
+        """Initialize the client with a (shared) aiohttp session and scheduler."""
+        self.metrics = metrics or FetchMetrics()
+        self._session = session
+        self._scheduler = scheduler
+        self._retry = retry_policy or RetryPolicy()
+        self._base_url = base_url
+        self._headers = {
+            "x-api-key": api_key,
+            "Accept": "application/json",
+        }
+        self._validators: dict[str, _Validators] = {}
+
+    def invalidate(self) -> None:
+        """Forget all validators, so the next requests fetch full responses.
+
+        Callers do this when they could not use a response, so that it is not
+        reported as unchanged next time.
+        """
+        self._validators.clear()
+
+    async def async_get_user(
+        self,
+        userid: str,
+        priority: int = PRIORITY_POLL,
+        conditional: bool = False,
+    ) -> dict[str, Any] | None:
+        """Fetch the profile of a setlist.fm user."""
+        return await self._async_get(
+            f"/user/{userid}", "user", priority=priority, conditional=conditional
+        )
+
+    async def async_get_attended_page(
+        self,
+        userid: str,
+        page: int = 1,
+        priority: int = PRIORITY_POLL,
+        conditional: bool = False,
+    ) -> dict[str, Any] | None:
+        """Fetch one page of the setlists a user has attended (newest first)."""
+        return await self._async_get(
+            f"/user/{userid}/attended",
+            "attended",
+            params={"p": page},
+            priority=priority,
+            conditional=conditional,
+        )
+
+    async def async_get_artist_setlists(
+        self,
+        mbid: str,
+        page: int = 1,
+        priority: int = PRIORITY_POLL,
+        conditional: bool = False,
+    ) -> dict[str, Any] | None:
+        """Fetch one page of an artist's setlists (newest first)."""
+        return await self._async_get(
+            f"/artist/{mbid}/setlists",
+            "artist",
+            params={"p": page},
+            priority=priority,
+            conditional=conditional,
+        )
+
+    async def _async_get(
+        self,
+        path: str,
+        endpoint: str,
+        params: dict[str, Any] | None = None,
+        priority: int = PRIORITY_POLL,
+        conditional: bool = False,
+    ) -> dict[str, Any] | None:
+        """GET an endpoint, retrying transient failures per the retry policy."""
+        url = f"{self._base_url}{path}"
+        key = f"{path}?{sorted((params or {}).items())}"
+
+        headers = self._headers
+        previous = self._validators.get(key) if conditional else None
+        if previous is not None:
+            headers = dict(self._headers)
+            if previous.etag:
+                headers[hdrs.IF_NONE_MATCH] = previous.etag
+            if previous.last_modified:
+                headers[hdrs.IF_MODIFIED_SINCE] = previous.last_modified
+
+        breaker = self._scheduler.breaker
+        if priority != PRIORITY_USER and not breaker.allow():
+            # Manual refreshes still get through and act as the probe
+            raise SetlistFmUnavailableError(
+                "setlist.fm is unavailable, polling is paused until it recovers"
+            )
+
+        metrics = self.metrics
+        attempts = self._retry.attempts
+        for attempt in range(attempts):
+            await self._scheduler.async_acquire(priority)
+            retry_after: float | None = None
+            cause: Exception | None = None
+            started = monotonic()
+            try:
+                async with self._session.get(
+                    url, headers=headers, params=params
+                ) as response:
+                    metrics.record_request(
+                        endpoint, monotonic() - started, response.status
+                    )
+                    if response.status == 304 and previous is not None:
+                        metrics.record_response(0, not_modified=True)
+                        breaker.record_success()
+                        return None
+                    if response.status == 200:
+                        body = await response.read()
+                        breaker.record_success()
+                        digest = hashlib.sha256(body).digest()
+                        unchanged = previous is not None and previous.digest == digest
+                        metrics.record_response(len(body), not_modified=unchanged)
+                        if unchanged:
+                            return None
+                        decode_started = monotonic()
+                        data = json_loads(body)
+                        metrics.decode_time += monotonic() - decode_started
+                        if conditional:
+                            self._validators[key] = _Validators(
+                                response.headers.get(hdrs.ETAG),
+                                response.headers.get(hdrs.LAST_MODIFIED),
+                                digest,
+                            )
+                        return data
+
+                    if response.status == 429:
+                        error: SetlistFmError = SetlistFmRateLimitError(
+                            f"Rate limit exceeded after {attempt + 1} attempt(s)"
+                        )
+                    elif response.status in RETRY_STATUSES:
+                        error = SetlistFmError(
+                            f"Error fetching {path}: {response.status}"
+                        )
+                    else:
+                        # setlist.fm answered; it is up even if it said no
+                        breaker.record_success()
+                        if response.status == 401:
+                            raise SetlistFmAuthError("Invalid API key")
+                        if response.status == 404:
+                            raise SetlistFmNotFoundError(f"Not found: {path}")
+                        raise SetlistFmError(
+                            f"Error fetching {path}: {response.status}"
+                        )
+                    retry_after = _parse_retry_after(
+                        response.headers.get(hdrs.RETRY_AFTER)
+                    )
+
+            except SetlistFmError:
+                raise
+            except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as err:
+                error = SetlistFmError(f"Error connecting to setlist.fm: {err}")
+                cause = err
+
+            rate_limited = isinstance(error, SetlistFmRateLimitError)
+            if retry_after is not None and retry_after > self._retry.max_delay:
+                # Too long to wait inside a refresh; hold back the whole key
+                # and let the next poll try again
+                self._scheduler.pause(retry_after)
+                break
+            if attempt + 1 == attempts:
+                break
+
+            metrics.record_retry()
+            delay = self._retry.delay(attempt, retry_after)
+            _LOGGER.warning(
+                "%s, retrying in %.1f seconds (attempt %d/%d)",
+                error,
+                delay,
+                attempt + 1,
+                attempts,
+            )
+            if rate_limited:
+                # Slow down every entry on this key, not just this one
+                self._scheduler.pause(delay)
+            else:
+                await asyncio.sleep(delay)
+
+        if not rate_limited:
+            breaker.record_failure()
+        raise error from cause
+
+
+class RetryPolicy:
+    """Capped exponential backoff with full jitter.
+
+    A Retry-After sent by the server is honoured instead of the backoff.
+    """
+
+    def __init__(
+        self, attempts: int = 4, base_delay: float = 2.0, max_delay: float = 60.0
+    ) -> None:
+        """Initialize the policy."""
+        self.attempts = attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+    def delay(self, attempt: int, retry_after: float | None = None) -> float:
+        """Return the seconds to wait after the given (0-based) failed attempt."""
+        if retry_after is not None:
+            return retry_after
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2**attempt))
+
+
+def _parse_retry_after(value: str | None) -> float | None:
+    """Parse a Retry-After header given in seconds or as an HTTP date."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=dt_util.UTC)
+    return max(0.0, (retry_at - dt_util.utcnow()).total_seconds())
+
+
+class SetlistFmError(HomeAssistantError):
+    """Error to indicate a failed request to setlist.fm."""
+
+
+class SetlistFmAuthError(SetlistFmError):
+    """Error to indicate the API key was rejected."""
+
+
+class SetlistFmNotFoundError(SetlistFmError):
+    """Error to indicate the requested resource does not exist."""
+
+
+class SetlistFmRateLimitError(SetlistFmError):
+    """Error to indicate setlist.fm kept rejecting requests with 429."""
+
+
+class SetlistFmUnavailableError(SetlistFmError):
+    """Error to indicate requests are suspended during an outage."""
@@ -0,0 +1,85 @@
+"""Calendar platform for setlist.fm integration."""
+from __future__ import annotations
+
+from datetime import datetime, time, timedelta
+
+from homeassistant.components.calendar import CalendarEntity, CalendarEvent
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.util import dt as dt_util
+
+from . import SetlistFmCoordinator
+from .const import DOMAIN
+from .entity import SetlistFmEntity
+from .models import Concert, ConcertIndex
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up the setlist.fm calendar based on a config entry."""
+    coordinator: SetlistFmCoordinator = hass.data[DOMAIN][entry.entry_id]
+    async_add_entities([SetlistFmCalendar(coordinator, entry)])
+
+
+def _event(concert: Concert) -> CalendarEvent:
+    """Return a concert as an all-day event."""
+    venue = concert.venue
+    details = [f"Tour: {concert.tour}"] if concert.tour else []
+    if concert.song_count:
+        details.append(f"Songs: {concert.song_count}")
+    if concert.url:
+        details.append(concert.url)
+    return CalendarEvent(
+        start=concert.date,
+        end=concert.date + timedelta(days=1),
+        summary=concert.artist.name or "Unknown",
+        location=", ".join(
+            part for part in (venue.name, venue.city, venue.country) if part
+        ),
+        description="\n".join(details) or None,
+        uid=concert.id,
+    )
+
+
+class SetlistFmCalendar(SetlistFmEntity, CalendarEntity):
+    """Attended and upcoming shows of a setlist.fm user as all-day events.
+
+    Range queries are answered by binary search over the date-sorted index
+    built at sync time, so paging through years of history stays cheap.
+    """
+
+    _attr_icon = "mdi:calendar-music"
+
+    def __init__(self, coordinator: SetlistFmCoordinator, entry: ConfigEntry) -> None:
+        """Initialize the calendar."""
+        super().__init__(coordinator, entry, "calendar", "Concerts")
+
+    @property
+    def event(self) -> CalendarEvent | None:
+        """Return today's show, or else the next one."""
+        if self.coordinator.data is None:
+            return None
+        index: ConcertIndex = self.coordinator.data["index"]
+        # Furthest in the future first, so the next show is the last one
+        if upcoming := index.upcoming(dt_util.now().date()):
+            return _event(upcoming[-1])
+        return None
+
+    async def async_get_events(
+        self, hass: HomeAssistant, start_date: datetime, end_date: datetime
+    ) -> list[CalendarEvent]:
+        """Return the shows between two datetimes, oldest first."""
+        if self.coordinator.data is None:
+            return []
+        index: ConcertIndex = self.coordinator.data["index"]
+        start = dt_util.as_local(start_date)
+        end = dt_util.as_local(end_date)
+        # An all-day event overlaps the range unless the range ends at its start
+        last = end.date() if end.time() != time.min else end.date() - timedelta(days=1)
+        return [
+            _event(concert) for concert in reversed(index.between(start.date(), last))
+        ]
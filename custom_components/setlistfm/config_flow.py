@@ -1,15 +1,26 @@
 """Config flow for setlist.fm integration."""
+import asyncio
 import logging
 from typing import Any
 
-import aiohttp
 import voluptuous as vol
 
 from homeassistant import config_entries
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.exceptions import HomeAssistantError
-
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+
+from . import DATA_SEEDS, async_get_scheduler
+from .api import (
+    RetryPolicy,
+    SetlistFmAuthError,
+    SetlistFmClient,
+    SetlistFmError,
+    SetlistFmNotFoundError,
+)
+from .scheduler import PRIORITY_USER
+from .watchlist import MBID_PATTERN, parse_watchlist
 from .const import (
     DOMAIN,
     CONF_USERID,
@@ -19,10 +30,18 @@ from .const import (
     CONF_NUMBER_OF_CONCERTS,
     CONF_DATE_FORMAT,
     CONF_SHOW_CONCERTS,
+    CONF_RECORD_CONCERTS,
+    CONF_ADAPTIVE_REFRESH,
+    CONF_MAX_REFRESH_PERIOD,
+    CONF_WATCHED_ARTISTS,
     DEFAULT_REFRESH_PERIOD,
     DEFAULT_NUMBER_OF_CONCERTS,
     DEFAULT_DATE_FORMAT,
     DEFAULT_SHOW_CONCERTS,
+    DEFAULT_RECORD_CONCERTS,
+    DEFAULT_ADAPTIVE_REFRESH,
+    DEFAULT_WATCHED_ARTISTS,
+    DEFAULT_MAX_REFRESH_PERIOD,
     DATE_FORMATS,
     SHOW_CONCERTS_OPTIONS,
 )
@@ -34,34 +53,46 @@ async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str,
     """Validate the user input allows us to connect.
     
     Data has the keys from STEP_USER_DATA_SCHEMA with values provided by the user.
+    The profile and the first page of attended setlists are fetched together
+    through the shared session and request scheduler, and returned so the
+    new entry can start from them.
     """
-    headers = {
-        "x-api-key": data[CONF_API_KEY],
-        "Accept": "application/json",
-    }
-    
-    user_url = f"https://api.setlist.fm/rest/1.0/user/{data[CONF_USERID]}"
-    
-    async with aiohttp.ClientSession() as session:
-        try:
-            async with session.get(user_url, headers=headers) as response:
-                if response.status == 401:
-                    raise InvalidAuth
-                elif response.status == 404:
-                    raise UserNotFound
-                elif response.status != 200:
-                    raise CannotConnect
-                
-                user_data = await response.json()
-                
-                # Extract the username from the API response
-                username = user_data.get("fullname") or user_data.get("userId") or data[CONF_USERID]
-                
-                return {"title": username, "user_data": user_data}
-        
-        except aiohttp.ClientError as err:
-            _LOGGER.error("Error connecting to setlist.fm: %s", err)
-            raise CannotConnect from err
+    client = SetlistFmClient(
+        async_get_clientsession(hass),
+        data[CONF_API_KEY],
+        async_get_scheduler(hass, data[CONF_API_KEY]),
+        # The user is waiting on the form; report failures right away
+        RetryPolicy(attempts=1),
+    )
+    user_result, attended_result = await asyncio.gather(
+        client.async_get_user(data[CONF_USERID], PRIORITY_USER),
+        client.async_get_attended_page(data[CONF_USERID], 1, PRIORITY_USER),
+        return_exceptions=True,
+    )
+
+    if isinstance(user_result, SetlistFmAuthError):
+        raise InvalidAuth
+    if isinstance(user_result, SetlistFmNotFoundError):
+        raise UserNotFound
+    if isinstance(user_result, SetlistFmError):
+        _LOGGER.error("Error connecting to setlist.fm: %s", user_result)
+        raise CannotConnect from user_result
+    if isinstance(user_result, BaseException):
+        raise user_result
+    user_data = user_result
+
+    if isinstance(attended_result, SetlistFmNotFoundError):
+        # setlist.fm answers 404 when there are no attended setlists
+        attended_result = {"setlist": [], "total": 0}
+    elif isinstance(attended_result, BaseException):
+        # Not needed to validate; the first refresh fetches the history instead
+        _LOGGER.debug("Not seeding attended setlists: %s", attended_result)
+        attended_result = None
+
+    # Extract the username from the API response
+    username = user_data.get("fullname") or user_data.get("userId") or data[CONF_USERID]
+
+    return {"title": username, "user_data": user_data, "attended": attended_result}
 
 
 class SetlistFmConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
@@ -91,6 +122,13 @@ class SetlistFmConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 # Set unique ID to prevent duplicate entries for same user
                 await self.async_set_unique_id(user_input[CONF_USERID])
                 self._abort_if_unique_id_configured()
+
+                if info["attended"] is not None:
+                    # Picked up by async_setup_entry, so the first refresh
+                    # doesn't fetch all of this again
+                    self.hass.data.setdefault(DOMAIN, {}).setdefault(DATA_SEEDS, {})[
+                        user_input[CONF_USERID]
+                    ] = (info["user_data"], info["attended"])
                 
                 return self.async_create_entry(
                     title=info["title"],
@@ -104,6 +142,9 @@ class SetlistFmConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                         CONF_NUMBER_OF_CONCERTS: DEFAULT_NUMBER_OF_CONCERTS,
                         CONF_DATE_FORMAT: DEFAULT_DATE_FORMAT,
                         CONF_SHOW_CONCERTS: DEFAULT_SHOW_CONCERTS,
+                        CONF_RECORD_CONCERTS: DEFAULT_RECORD_CONCERTS,
+                        CONF_ADAPTIVE_REFRESH: DEFAULT_ADAPTIVE_REFRESH,
+                        CONF_MAX_REFRESH_PERIOD: DEFAULT_MAX_REFRESH_PERIOD,
                     },
                 )
         
@@ -141,10 +182,15 @@ class SetlistFmOptionsFlowHandler(config_entries.OptionsFlow):
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
         """Manage the options."""
+        errors: dict[str, str] = {}
         if user_input is not None:
-            return self.async_create_entry(title="", data=user_input)
-        
-        options = self._config_entry.options
+            watched = parse_watchlist(user_input.get(CONF_WATCHED_ARTISTS, ""))
+            if all(MBID_PATTERN.match(mbid) for mbid in watched):
+                user_input[CONF_WATCHED_ARTISTS] = ", ".join(watched)
+                return self.async_create_entry(title="", data=user_input)
+            errors[CONF_WATCHED_ARTISTS] = "invalid_mbid"
+
+        options = {**self._config_entry.options, **(user_input or {})}
         
         data_schema = vol.Schema(
             {
@@ -152,6 +198,16 @@ class SetlistFmOptionsFlowHandler(config_entries.OptionsFlow):
                     CONF_REFRESH_PERIOD,
                     default=options.get(CONF_REFRESH_PERIOD, DEFAULT_REFRESH_PERIOD),
                 ): vol.All(vol.Coerce(int), vol.Range(min=1, max=24)),
+                vol.Optional(
+                    CONF_ADAPTIVE_REFRESH,
+                    default=options.get(CONF_ADAPTIVE_REFRESH, DEFAULT_ADAPTIVE_REFRESH),
+                ): bool,
+                vol.Optional(
+                    CONF_MAX_REFRESH_PERIOD,
+                    default=options.get(
+                        CONF_MAX_REFRESH_PERIOD, DEFAULT_MAX_REFRESH_PERIOD
+                    ),
+                ): vol.All(vol.Coerce(int), vol.Range(min=1, max=336)),
                 vol.Optional(
                     CONF_NUMBER_OF_CONCERTS,
                     default=options.get(CONF_NUMBER_OF_CONCERTS, DEFAULT_NUMBER_OF_CONCERTS),
@@ -164,12 +220,21 @@ class SetlistFmOptionsFlowHandler(config_entries.OptionsFlow):
                     CONF_SHOW_CONCERTS,
                     default=options.get(CONF_SHOW_CONCERTS, DEFAULT_SHOW_CONCERTS),
                 ): vol.In(SHOW_CONCERTS_OPTIONS),
+                vol.Optional(
+                    CONF_RECORD_CONCERTS,
+                    default=options.get(CONF_RECORD_CONCERTS, DEFAULT_RECORD_CONCERTS),
+                ): bool,
+                vol.Optional(
+                    CONF_WATCHED_ARTISTS,
+                    default=options.get(CONF_WATCHED_ARTISTS, DEFAULT_WATCHED_ARTISTS),
+                ): str,
             }
         )
         
         return self.async_show_form(
             step_id="init",
             data_schema=data_schema,
+            errors=errors,
         )
 
 
@@ -1,7 +1,10 @@
 """Constants for the setlist.fm integration."""
+from datetime import timedelta
 
 DOMAIN = "setlistfm"
 
+ATTRIBUTION = "Data provided by setlist.fm (https://www.setlist.fm)"
+
 # Configuration
 CONF_USERID = "userid"
 CONF_API_KEY = "api_key"
@@ -12,12 +15,78 @@ CONF_REFRESH_PERIOD = "refresh_period"
 CONF_NUMBER_OF_CONCERTS = "number_of_concerts"
 CONF_DATE_FORMAT = "date_format"
 CONF_SHOW_CONCERTS = "show_concerts"
+CONF_RECORD_CONCERTS = "record_concerts"
+CONF_ADAPTIVE_REFRESH = "adaptive_refresh"
+CONF_MAX_REFRESH_PERIOD = "max_refresh_period"
+CONF_WATCHED_ARTISTS = "watched_artists"
 
 # Defaults
 DEFAULT_REFRESH_PERIOD = 6
 DEFAULT_NUMBER_OF_CONCERTS = 10
 DEFAULT_DATE_FORMAT = "%d-%m-%Y"
 DEFAULT_SHOW_CONCERTS = "all"
+DEFAULT_RECORD_CONCERTS = True
+DEFAULT_ADAPTIVE_REFRESH = False
+DEFAULT_MAX_REFRESH_PERIOD = 168
+DEFAULT_WATCHED_ARTISTS = ""
+
+# Days after a show during which its setlist is typically still being published
+SETLIST_PUBLISH_WINDOW = 3
+
+# How long a fetched user profile is reused before it is fetched again
+USER_PROFILE_TTL = timedelta(days=7)
+
+# Watched artists: how long fetched setlists are reused, how many artists one
+# poll refreshes at most, and how many are fetched at the same time
+ARTIST_SETLISTS_TTL = timedelta(hours=12)
+WATCHLIST_SLICE = 10
+WATCHLIST_CONCURRENCY = 3
+
+# Number of entries listed by the top artists/venues/cities/countries sensors
+STATS_TOP_N = 10
+
+# Number of most recent shared shows listed by the household sensor
+HOUSEHOLD_TOGETHER_LIMIT = 20
+
+# Dispatcher signal sent after every update attempt, formatted with the entry ID
+SIGNAL_METRICS_UPDATED = f"{DOMAIN}_metrics_updated_{{}}"
+SIGNAL_HOUSEHOLD_UPDATED = f"{DOMAIN}_household_updated"
+
+# Services
+SERVICE_REFRESH = "refresh"
+SERVICE_GET_CONCERTS = "get_concerts"
+SERVICE_SEARCH_SONGS = "search_songs"
+SERVICE_EXPORT = "export"
+ATTR_ENTRY_ID = "entry_id"
+ATTR_QUERY = "query"
+ATTR_MATCH = "match"
+ATTR_ARTIST = "artist"
+ATTR_LIMIT = "limit"
+ATTR_START_DATE = "start_date"
+ATTR_END_DATE = "end_date"
+ATTR_VENUE = "venue"
+ATTR_COUNTRY = "country"
+ATTR_SHOW = "show"
+ATTR_SORT = "sort"
+ATTR_CURSOR = "cursor"
+ATTR_FORMAT = "format"
+ATTR_INCREMENTAL = "incremental"
+
+# Song search match modes
+MATCH_EXACT = "exact"
+MATCH_PREFIX = "prefix"
+DEFAULT_SEARCH_LIMIT = 20
+
+# export formats, and the directory under the config directory written to
+EXPORT_FORMATS = ["jsonl", "csv"]
+DEFAULT_EXPORT_FORMAT = "jsonl"
+EXPORT_DIR = "setlistfm"
+
+# get_concerts sort orders and page size
+SORT_OPTIONS = ["date_desc", "date_asc", "artist", "venue"]
+DEFAULT_SORT = "date_desc"
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
 
 # Date format options
 DATE_FORMATS = {
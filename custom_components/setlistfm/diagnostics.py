@@ -0,0 +1,49 @@
+"""Diagnostics support for the setlist.fm integration."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import REDACTED, async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from . import SetlistFmCoordinator
+from .const import CONF_API_KEY, CONF_NAME, CONF_USERID, DOMAIN
+
+TO_REDACT = {CONF_API_KEY, CONF_USERID, CONF_NAME, "title", "unique_id"}
+
+
+def _redact_error(coordinator: SetlistFmCoordinator) -> str | None:
+    """Return the last error with the user ID taken out of its URLs and text."""
+    if not coordinator.last_exception:
+        return None
+    return str(coordinator.last_exception).replace(coordinator.userid, REDACTED)
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator: SetlistFmCoordinator = hass.data[DOMAIN][entry.entry_id]
+    breaker = coordinator.scheduler.breaker
+    data = coordinator.data or {}
+
+    return {
+        "entry": async_redact_data(entry.as_dict(), TO_REDACT),
+        "coordinator": {
+            "last_update_success": coordinator.last_update_success,
+            "last_exception": _redact_error(coordinator),
+            "update_interval": (
+                coordinator.update_interval.total_seconds()
+                if coordinator.update_interval
+                else None
+            ),
+            "concerts": len(data["index"]) if "index" in data else None,
+            "songs": len(coordinator.history.songs),
+        },
+        "circuit_breaker": {
+            "open": breaker.is_open,
+            "consecutive_failures": breaker.failures,
+        },
+        "metrics": coordinator.client.metrics.as_dict(),
+    }
@@ -0,0 +1,57 @@
+"""Base entity for the setlist.fm integration."""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.helpers.device_registry import DeviceEntryType
+from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .const import ATTRIBUTION, CONF_NAME, CONF_USERID, DOMAIN
+
+if TYPE_CHECKING:
+    from . import SetlistFmCoordinator
+
+
+def entry_name(entry: ConfigEntry) -> str:
+    """Return the name an entry's device and entities are shown under."""
+    return entry.data.get(CONF_NAME, entry.data[CONF_USERID])
+
+
+def device_info(entry: ConfigEntry) -> DeviceInfo:
+    """Shared device info for all setlist.fm entities belonging to this entry."""
+    return DeviceInfo(
+        identifiers={(DOMAIN, entry.entry_id)},
+        name=entry_name(entry),
+        manufacturer="setlist.fm",
+        entry_type=DeviceEntryType.SERVICE,
+    )
+
+
+class SetlistFmEntity(CoordinatorEntity["SetlistFmCoordinator"]):
+    """An entity showing data synced by an entry's coordinator."""
+
+    _attr_attribution = ATTRIBUTION
+
+    def __init__(
+        self,
+        coordinator: SetlistFmCoordinator,
+        entry: ConfigEntry,
+        key: str,
+        name: str,
+    ) -> None:
+        """Initialize the entity."""
+        super().__init__(coordinator)
+        self._attr_name = f"{entry_name(entry)} {name}"
+        self._attr_unique_id = f"{entry.entry_id}_{key}"
+        self._attr_device_info = device_info(entry)
+
+    @property
+    def available(self) -> bool:
+        """Stay available while there is (possibly cached) data to show.
+
+        A failed refresh is reported through the concerts sensor's
+        last_update_success/last_error attributes.
+        """
+        return self.coordinator.data is not None
@@ -0,0 +1,166 @@
+"""Write an attended history to JSON Lines or CSV files.
+
+The functions here do blocking file I/O and are meant to run in the
+executor.
+"""
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+import csv
+from datetime import date
+from itertools import islice
+import os
+from pathlib import Path
+from typing import Any
+
+from homeassistant.helpers.json import json_bytes
+from homeassistant.util.json import json_loads
+
+from .models import Concert
+
+# Concerts serialized and written per write call
+EXPORT_CHUNK_SIZE = 500
+
+CSV_FIELDS = [
+    "id",
+    "date",
+    "artist",
+    "artist_mbid",
+    "venue",
+    "city",
+    "state",
+    "country",
+    "country_code",
+    "tour",
+    "song_count",
+    "songs",
+    "url",
+]
+
+# Joins the song names in a CSV cell
+CSV_SONG_SEPARATOR = "; "
+
+
+def _row(concert: Concert) -> dict[str, Any]:
+    """Return a concert as one export record, songs included."""
+    venue = concert.venue
+    return {
+        "id": concert.id,
+        "date": concert.date.isoformat(),
+        "artist": concert.artist.name,
+        "artist_mbid": concert.artist.mbid,
+        "venue": venue.name,
+        "city": venue.city,
+        "state": venue.state,
+        "country": venue.country,
+        "country_code": venue.country_code,
+        "tour": concert.tour,
+        "song_count": concert.song_count,
+        "songs": list(concert.songs) if concert.songs is not None else None,
+        "url": concert.url,
+    }
+
+
+def _chunks(concerts: Iterable[Concert]) -> Iterator[list[Concert]]:
+    iterator = iter(concerts)
+    while chunk := list(islice(iterator, EXPORT_CHUNK_SIZE)):
+        yield chunk
+
+
+def _read_exported(path: Path, export_format: str) -> tuple[set[str], date | None]:
+    """Read the IDs and the newest date of the concerts in an export file.
+
+    Raises ValueError if the file is not an export in this format.
+    """
+    newline = "" if export_format == "csv" else None
+    ids: set[str] = set()
+    newest: date | None = None
+    try:
+        with path.open(encoding="utf-8", newline=newline) as file:
+            if export_format == "csv":
+                records: Iterable[dict[str, Any]] = csv.DictReader(file)
+            else:
+                records = (json_loads(line) for line in file if line.strip())
+            for record in records:
+                ids.add(record["id"])
+                concert_date = date.fromisoformat(record["date"])
+                if newest is None or concert_date > newest:
+                    newest = concert_date
+    except (KeyError, TypeError, ValueError, csv.Error) as err:
+        raise ValueError(f"{path} is not a {export_format} export: {err!r}") from err
+    return ids, newest
+
+
+def _write_jsonl(file: Any, concerts: Iterable[Concert]) -> None:
+    for chunk in _chunks(concerts):
+        file.write(
+            b"".join(json_bytes(_row(concert)) + b"\n" for concert in chunk)
+        )
+
+
+def _write_csv(file: Any, concerts: Iterable[Concert], header: bool) -> None:
+    writer = csv.DictWriter(file, CSV_FIELDS)
+    if header:
+        writer.writeheader()
+    for chunk in _chunks(concerts):
+        rows = []
+        for concert in chunk:
+            row = _row(concert)
+            if row["songs"] is not None:
+                row["songs"] = CSV_SONG_SEPARATOR.join(row["songs"])
+            rows.append(row)
+        writer.writerows(rows)
+
+
+def export_concerts(
+    path: Path,
+    concerts: list[Concert],
+    export_format: str,
+    incremental: bool = False,
+) -> int:
+    """Write concerts (newest first) to a file, oldest first; return the count.
+
+    A full export replaces the file atomically. An incremental export
+    appends only the concerts whose IDs are not in the file yet. It falls
+    back to a full export when there is no file, or when a new concert is
+    older than the newest one exported (e.g. an old show marked as attended
+    later), so the file stays oldest first. Concerts are serialized a chunk
+    at a time, so memory use does not grow with the history.
+
+    Raises OSError if the file can't be written and ValueError if an
+    existing file is not an export in this format.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    binary = export_format == "jsonl"
+
+    if incremental and path.exists():
+        exported, newest = _read_exported(path, export_format)
+        new = [
+            concert for concert in reversed(concerts) if concert.id not in exported
+        ]
+        if not new:
+            return 0
+        # Oldest first, so only the first new concert can precede the file's end
+        if newest is None or new[0].date >= newest:
+            if binary:
+                with path.open("ab") as file:
+                    _write_jsonl(file, new)
+            else:
+                with path.open("a", newline="", encoding="utf-8") as file:
+                    _write_csv(file, new, header=False)
+            return len(new)
+        # An older show turned up; rewrite the file below to keep the order
+
+    temp_path = path.with_name(f"{path.name}.tmp")
+    try:
+        if binary:
+            with temp_path.open("wb") as file:
+                _write_jsonl(file, reversed(concerts))
+        else:
+            with temp_path.open("w", newline="", encoding="utf-8") as file:
+                _write_csv(file, reversed(concerts), header=True)
+        os.replace(temp_path, path)
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
+    return len(concerts)
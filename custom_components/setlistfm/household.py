@@ -0,0 +1,200 @@
+"""Combined view of the attended histories of every configured user."""
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections.abc import Callable
+import heapq
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+
+from .const import SIGNAL_HOUSEHOLD_UPDATED
+from .models import Concert, ConcertIndex
+from .stats import ConcertStats
+
+# Above this share of new shows, one linear merge beats inserting them one by one
+MERGE_RATIO = 0.1
+
+
+def _key(concert: Concert) -> tuple[int, str]:
+    """Sort key putting the newest shows first, unique per setlist."""
+    return (-concert.date.toordinal(), concert.id or "")
+
+
+class Household:
+    """The union of all entries' histories, de-duplicated by setlist ID.
+
+    A member joining is merged in with one pass over the two sorted lists.
+    After that, each refresh of a member only applies what changed in that
+    member's history: new shows are inserted by binary search and the
+    statistics are adjusted one show at a time.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize an empty household."""
+        self._hass = hass
+        self.names: dict[str, str] = {}
+        # Newest first, with the sort keys alongside for bisect
+        self.concerts: list[Concert] = []
+        self._keys: list[tuple[int, str]] = []
+        self._by_id: dict[str, Concert] = {}
+        self._attendees: dict[str, set[str]] = {}
+        self._members: dict[str, dict[str, Concert]] = {}
+        self._indexes: dict[str, ConcertIndex] = {}
+        self.together: set[str] = set()
+        self.stats = ConcertStats()
+        self._sensor_adders: dict[str, Callable[[], None]] = {}
+        self._sensor_owner: str | None = None
+
+    def member_shows(self, entry_id: str) -> int:
+        """Return the number of shows a member attended."""
+        return len(self._members.get(entry_id, {}))
+
+    def attendees(self, setlist_id: str) -> list[str]:
+        """Return the names of the members who attended a show."""
+        return sorted(
+            self.names[entry_id] for entry_id in self._attendees[setlist_id]
+        )
+
+    def shows_together(self, limit: int) -> list[Concert]:
+        """Return the most recent shows attended by several members."""
+        found: list[Concert] = []
+        for concert in self.concerts:
+            if len(found) == limit or len(found) == len(self.together):
+                break
+            if concert.id in self.together:
+                found.append(concert)
+        return found
+
+    @callback
+    def async_add_member(
+        self, entry_id: str, name: str, coordinator: DataUpdateCoordinator
+    ) -> CALLBACK_TYPE:
+        """Follow a member's coordinator; return a callback that removes it."""
+        self.names[entry_id] = name
+        self._members[entry_id] = {}
+
+        @callback
+        def _async_coordinator_updated() -> None:
+            if coordinator.data is None:
+                return
+            index: ConcertIndex = coordinator.data["index"]
+            # Listeners also fire when only the date rolled over
+            if index is self._indexes.get(entry_id):
+                return
+            self._indexes[entry_id] = index
+            self._update(entry_id, index.concerts)
+            async_dispatcher_send(self._hass, SIGNAL_HOUSEHOLD_UPDATED)
+
+        _async_coordinator_updated()
+        remove_listener = coordinator.async_add_listener(_async_coordinator_updated)
+
+        @callback
+        def _async_remove_member() -> None:
+            remove_listener()
+            self._update(entry_id, [])
+            del self._members[entry_id]
+            del self.names[entry_id]
+            self._indexes.pop(entry_id, None)
+            async_dispatcher_send(self._hass, SIGNAL_HOUSEHOLD_UPDATED)
+
+        return _async_remove_member
+
+    @callback
+    def async_add_sensor_platform(
+        self, entry_id: str, add_sensor: Callable[[], None]
+    ) -> CALLBACK_TYPE:
+        """Offer an entry's sensor platform to hold the household sensor.
+
+        Only one entry holds the sensor; when it is unloaded the sensor is
+        handed over to another entry's platform.
+        """
+        self._sensor_adders[entry_id] = add_sensor
+        self._async_ensure_sensor()
+
+        @callback
+        def _async_remove_sensor_platform() -> None:
+            del self._sensor_adders[entry_id]
+            if self._sensor_owner == entry_id:
+                self._sensor_owner = None
+                self._async_ensure_sensor()
+
+        return _async_remove_sensor_platform
+
+    @callback
+    def _async_ensure_sensor(self) -> None:
+        """Create the sensor once there are several members to combine."""
+        if self._sensor_owner is not None or len(self._members) < 2:
+            return
+        for entry_id, add_sensor in self._sensor_adders.items():
+            if entry_id in self._members:
+                self._sensor_owner = entry_id
+                add_sensor()
+                return
+
+    def _update(self, entry_id: str, concerts: list[Concert]) -> None:
+        """Apply a member's new history (newest first) to the household."""
+        old = self._members[entry_id]
+        new = {concert.id: concert for concert in concerts}
+        for setlist_id, concert in old.items():
+            if setlist_id not in new:
+                self._leave(entry_id, concert)
+
+        added: list[Concert] = []
+        for concert in concerts:
+            if (previous := old.get(concert.id)) is concert:
+                continue
+            attendees = self._attendees.setdefault(concert.id, set())
+            attendees.add(entry_id)
+            if len(attendees) > 1:
+                self.together.add(concert.id)
+            current = self._by_id.get(concert.id)
+            if current is None or current is previous:
+                # New to the household, or this member's copy of it changed
+                if current is not None:
+                    self._discard(current)
+                added.append(concert)
+
+        self._members[entry_id] = new
+        self._insert(added)
+
+    def _leave(self, entry_id: str, concert: Concert) -> None:
+        """Drop a member from a show, and the show once nobody attended it."""
+        attendees = self._attendees[concert.id]
+        attendees.discard(entry_id)
+        if len(attendees) < 2:
+            self.together.discard(concert.id)
+        current = self._by_id[concert.id]
+        if not attendees:
+            del self._attendees[concert.id]
+            self._discard(current)
+        elif current is concert:
+            # Hold a remaining attendee's copy, so their refreshes replace it
+            self._discard(current)
+            self._insert([self._members[next(iter(attendees))][concert.id]])
+
+    def _discard(self, concert: Concert) -> None:
+        position = bisect_left(self._keys, _key(concert))
+        del self._keys[position]
+        del self.concerts[position]
+        del self._by_id[concert.id]
+        self.stats.remove(concert)
+
+    def _insert(self, concerts: list[Concert]) -> None:
+        """Add shows new to the household."""
+        # Members' lists are sorted by date only; order same-day shows by ID
+        # too (nearly sorted already, so this is a linear pass)
+        concerts.sort(key=_key)
+        for concert in concerts:
+            self._by_id[concert.id] = concert
+            self.stats.add(concert)
+        if len(concerts) > len(self.concerts) * MERGE_RATIO:
+            self.concerts = list(heapq.merge(self.concerts, concerts, key=_key))
+            self._keys = [_key(concert) for concert in self.concerts]
+            return
+        for concert in concerts:
+            key = _key(concert)
+            position = bisect_left(self._keys, key)
+            self._keys.insert(position, key)
+            self.concerts.insert(position, concert)
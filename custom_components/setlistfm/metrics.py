@@ -0,0 +1,113 @@
+"""Runtime metrics of the setlist.fm fetch pipeline."""
+from __future__ import annotations
+
+from collections import deque
+from datetime import datetime
+from typing import Any
+
+from homeassistant.util import dt as dt_util
+
+# Latency samples kept per endpoint for the percentiles
+LATENCY_SAMPLES = 100
+
+
+class FetchMetrics:
+    """Counters and timings of one entry's requests and syncs.
+
+    Recording is a counter increment or a deque append, cheap enough to
+    stay on for every request.
+    """
+
+    def __init__(self) -> None:
+        """Initialize empty metrics."""
+        self.latencies: dict[str, deque[float]] = {}
+        self.requests = 0
+        self.retries = 0
+        self.rate_limited = 0
+        self.bytes_downloaded = 0
+        self.responses = 0
+        self.not_modified = 0
+        self.decode_time = 0.0
+        self.normalize_time = 0.0
+        self.syncs = 0
+        self.failed_syncs = 0
+        self.last_sync_duration: float | None = None
+        self.last_success: datetime | None = None
+
+    def record_request(self, endpoint: str, latency: float, status: int) -> None:
+        """Record an answered request and how long the answer took."""
+        self.requests += 1
+        if status == 429:
+            self.rate_limited += 1
+        if (samples := self.latencies.get(endpoint)) is None:
+            samples = self.latencies[endpoint] = deque(maxlen=LATENCY_SAMPLES)
+        samples.append(latency)
+
+    def record_response(self, size: int, not_modified: bool) -> None:
+        """Record a usable response, and whether it was a cache hit."""
+        self.responses += 1
+        self.bytes_downloaded += size
+        if not_modified:
+            self.not_modified += 1
+
+    def record_retry(self) -> None:
+        """Record a retried request."""
+        self.retries += 1
+
+    def record_sync(
+        self, duration: float, success: bool, normalize_time: float = 0.0
+    ) -> None:
+        """Record the outcome of a coordinator update."""
+        self.syncs += 1
+        self.last_sync_duration = duration
+        self.normalize_time += normalize_time
+        if success:
+            self.last_success = dt_util.utcnow()
+        else:
+            self.failed_syncs += 1
+
+    @property
+    def cache_hit_rate(self) -> float | None:
+        """Share of responses that were unchanged since the previous fetch."""
+        if not self.responses:
+            return None
+        return self.not_modified / self.responses
+
+    def latency_percentiles(self, endpoint: str) -> dict[str, float] | None:
+        """Return p50/p90/p99 latency in milliseconds for an endpoint."""
+        if not (samples := self.latencies.get(endpoint)):
+            return None
+        ordered = sorted(samples)
+        return {
+            f"p{percent}": round(
+                1000 * ordered[(len(ordered) - 1) * percent // 100],
+                1,
+            )
+            for percent in (50, 90, 99)
+        }
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return all metrics, e.g. for diagnostics."""
+        since_success = (
+            (dt_util.utcnow() - self.last_success).total_seconds()
+            if self.last_success
+            else None
+        )
+        return {
+            "latency_ms": {
+                endpoint: self.latency_percentiles(endpoint)
+                for endpoint in self.latencies
+            },
+            "requests": self.requests,
+            "retries": self.retries,
+            "rate_limited": self.rate_limited,
+            "bytes_downloaded": self.bytes_downloaded,
+            "cache_hit_rate": self.cache_hit_rate,
+            "decode_time": round(self.decode_time, 4),
+            "normalize_time": round(self.normalize_time, 4),
+            "syncs": self.syncs,
+            "failed_syncs": self.failed_syncs,
+            "last_sync_duration": self.last_sync_duration,
+            "last_success": self.last_success.isoformat() if self.last_success else None,
+            "seconds_since_success": since_success,
+        }
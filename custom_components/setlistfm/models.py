@@ -0,0 +1,266 @@
+"""Compact concert model built from setlist.fm payloads at ingest."""
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from datetime import date, datetime
+import sys
+from typing import Any
+from weakref import WeakValueDictionary
+
+# setlist.fm always reports eventDate in this format
+EVENT_DATE_FORMAT = "%d-%m-%Y"
+
+
+def _intern(value: Any) -> Any:
+    """Intern strings that repeat across shows and entries."""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+class Artist:
+    """An artist, shared by every concert (in any entry) that references it."""
+
+    __slots__ = ("mbid", "name", "__weakref__")
+
+    _pool: WeakValueDictionary[tuple, Artist] = WeakValueDictionary()
+
+    def __init__(self, mbid: str | None, name: str | None) -> None:
+        """Initialize the artist."""
+        self.mbid = mbid
+        self.name = name
+
+    @classmethod
+    def shared(cls, mbid: str | None, name: str | None) -> Artist:
+        """Return the one instance for this artist, creating it if needed."""
+        key = (mbid, name)
+        if (artist := cls._pool.get(key)) is None:
+            artist = cls._pool[key] = cls(_intern(mbid), _intern(name))
+        return artist
+
+
+class Venue:
+    """A venue, shared by every concert (in any entry) that references it."""
+
+    __slots__ = (
+        "id",
+        "name",
+        "city",
+        "state",
+        "country",
+        "country_code",
+        "__weakref__",
+    )
+
+    _pool: WeakValueDictionary[tuple, Venue] = WeakValueDictionary()
+
+    def __init__(
+        self,
+        venue_id: str | None,
+        name: str | None,
+        city: str,
+        state: str,
+        country: str,
+        country_code: str,
+    ) -> None:
+        """Initialize the venue."""
+        self.id = venue_id
+        self.name = name
+        self.city = city
+        self.state = state
+        self.country = country
+        self.country_code = country_code
+
+    @classmethod
+    def shared(cls, *fields: Any) -> Venue:
+        """Return the one instance for this venue, creating it if needed."""
+        if (venue := cls._pool.get(fields)) is None:
+            venue = cls._pool[fields] = cls(*(_intern(field) for field in fields))
+        return venue
+
+    def as_list(self) -> list[Any]:
+        """Return the fields in constructor order, for the on-disk cache."""
+        return [
+            self.id,
+            self.name,
+            self.city,
+            self.state,
+            self.country,
+            self.country_code,
+        ]
+
+
+class Concert:
+    """One attended show, reduced to the fields the integration uses.
+
+    Song names are only kept when a feature needs them; otherwise just the
+    count is.
+    """
+
+    __slots__ = (
+        "id",
+        "date",
+        "event_date",
+        "artist",
+        "venue",
+        "tour",
+        "url",
+        "song_count",
+        "songs",
+    )
+
+    def __init__(
+        self,
+        setlist_id: str | None,
+        event_date: str,
+        artist: Artist,
+        venue: Venue,
+        tour: str | None = None,
+        url: str = "",
+        song_count: int = 0,
+        songs: tuple[str, ...] | None = None,
+    ) -> None:
+        """Initialize the concert; raises ValueError on a bad eventDate."""
+        self.id = setlist_id
+        self.event_date = event_date
+        self.date: date = datetime.strptime(event_date, EVENT_DATE_FORMAT).date()
+        self.artist = artist
+        self.venue = venue
+        self.tour = tour
+        self.url = url
+        self.song_count = song_count
+        self.songs = songs
+
+    @classmethod
+    def from_setlist(cls, setlist: dict[str, Any], keep_songs: bool = False) -> Concert:
+        """Build a concert from a setlist as returned by the API."""
+        artist = setlist.get("artist", {})
+        venue = setlist.get("venue", {})
+        city = venue.get("city", {})
+        country = city.get("country", {})
+
+        songs = [
+            song.get("name", "")
+            for set_item in setlist.get("sets", {}).get("set", [])
+            for song in set_item.get("song", [])
+        ]
+
+        return cls(
+            setlist.get("id"),
+            setlist["eventDate"],
+            Artist.shared(artist.get("mbid"), artist.get("name")),
+            Venue.shared(
+                venue.get("id"),
+                venue.get("name"),
+                city.get("name", ""),
+                city.get("state", ""),
+                country.get("name", ""),
+                country.get("code", ""),
+            ),
+            _intern(setlist.get("tour", {}).get("name")),
+            setlist.get("url", ""),
+            len(songs),
+            tuple(_intern(song) for song in songs) if keep_songs else None,
+        )
+
+    @classmethod
+    def from_cached(cls, data: dict[str, Any]) -> Concert:
+        """Build a concert from its on-disk cache representation."""
+        songs = data.get("songs")
+        return cls(
+            data["id"],
+            data["date"],
+            Artist.shared(*data["artist"]),
+            Venue.shared(*data["venue"]),
+            _intern(data.get("tour")),
+            data.get("url", ""),
+            data.get("song_count", 0),
+            tuple(_intern(song) for song in songs) if songs is not None else None,
+        )
+
+    def to_cached(self) -> dict[str, Any]:
+        """Return the compact on-disk cache representation."""
+        data: dict[str, Any] = {
+            "id": self.id,
+            "date": self.event_date,
+            "artist": [self.artist.mbid, self.artist.name],
+            "venue": self.venue.as_list(),
+            "url": self.url,
+            "song_count": self.song_count,
+        }
+        if self.tour:
+            data["tour"] = self.tour
+        if self.songs is not None:
+            data["songs"] = list(self.songs)
+        return data
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the simplified representation exposed in sensor attributes."""
+        return {
+            "id": self.id,
+            "date": self.event_date,
+            "artist": {
+                "name": self.artist.name or "Unknown",
+                "mbid": self.artist.mbid,
+            },
+            "venue": {
+                "name": self.venue.name or "Unknown",
+                "city": self.venue.city,
+                "state": self.venue.state,
+                "country": self.venue.country,
+            },
+            "song_count": self.song_count,
+            "url": self.url,
+        }
+
+
+class ConcertIndex:
+    """Concerts sorted newest first, with past/upcoming views per day.
+
+    The views are recomputed by binary search only when the local date
+    changes, so reading them is a list lookup.
+    """
+
+    def __init__(self, concerts: list[Concert]) -> None:
+        """Initialize from concerts already sorted newest first."""
+        self.concerts = concerts
+        # Negated ordinals ascend as dates descend, which is what bisect needs
+        self._keys = [-concert.date.toordinal() for concert in concerts]
+        self._views_date: date | None = None
+        self._upcoming: list[Concert] = []
+        self._past: list[Concert] = []
+
+    @classmethod
+    def from_concerts(cls, concerts: list[Concert]) -> ConcertIndex:
+        """Build the index, sorting the concerts by date, newest first."""
+        return cls(sorted(concerts, key=lambda concert: concert.date, reverse=True))
+
+    def __len__(self) -> int:
+        """Return the number of concerts."""
+        return len(self.concerts)
+
+    def upcoming(self, today: date) -> list[Concert]:
+        """Concerts on or after today, furthest in the future first."""
+        self._update_views(today)
+        return self._upcoming
+
+    def past(self, today: date) -> list[Concert]:
+        """Concerts before today, most recent first."""
+        self._update_views(today)
+        return self._past
+
+    def between(self, start: date | None, end: date | None) -> list[Concert]:
+        """Concerts from start to end (inclusive, either open), newest first."""
+        low = 0 if end is None else bisect_left(self._keys, -end.toordinal())
+        high = (
+            len(self._keys)
+            if start is None
+            else bisect_right(self._keys, -start.toordinal())
+        )
+        return self.concerts[low:high]
+
+    def _update_views(self, today: date) -> None:
+        if today == self._views_date:
+            return
+        split = bisect_right(self._keys, -today.toordinal())
+        self._upcoming = self.concerts[:split]
+        self._past = self.concerts[split:]
+        self._views_date = today
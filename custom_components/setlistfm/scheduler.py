@@ -0,0 +1,204 @@
+"""Request scheduling shared by all config entries using the same API key."""
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, time, timedelta
+import heapq
+import itertools
+import logging
+from time import monotonic
+
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+_LOGGER = logging.getLogger(__name__)
+
+# Documented setlist.fm limits for a standard API key
+RATE_LIMIT_PER_SECOND = 2
+RATE_LIMIT_PER_DAY = 1440
+
+# Consecutive failed requests before polling is suspended, and for how long
+BREAKER_THRESHOLD = 5
+BREAKER_RESET_TIMEOUT = 300
+BREAKER_MAX_RESET_TIMEOUT = 3600
+
+# Lower values are served first
+PRIORITY_USER = 0
+PRIORITY_POLL = 10
+
+
+class TokenBucket:
+    """Classic token bucket; starts full.
+
+    The capacity bounds the burst: with a capacity of 1, requests are spaced
+    evenly at the rate.
+    """
+
+    def __init__(self, rate: float, capacity: float) -> None:
+        """Initialize the bucket with a refill rate in tokens per second."""
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self._updated = monotonic()
+
+    def _refill(self) -> None:
+        now = monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def delay(self) -> float:
+        """Return how many seconds until a token is available."""
+        self._refill()
+        if self.tokens >= 1:
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+    def consume(self) -> None:
+        """Take one token."""
+        self._refill()
+        self.tokens -= 1
+
+
+class DailyQuota:
+    """Requests allowed per UTC day, counted the way setlist.fm counts them.
+
+    A bucket refilling over 24 hours would hand out its full capacity and
+    then the refill on top of it, up to twice the quota in one day.
+    """
+
+    def __init__(self, limit: int) -> None:
+        """Initialize the quota with nothing used today."""
+        self.limit = limit
+        self.used = 0
+        self._day = dt_util.utcnow().date()
+
+    def _roll(self) -> datetime:
+        """Start counting afresh once the UTC day changed; return the time."""
+        now = dt_util.utcnow()
+        if now.date() != self._day:
+            self._day = now.date()
+            self.used = 0
+        return now
+
+    def delay(self) -> float:
+        """Return how many seconds until a request may be sent."""
+        now = self._roll()
+        if self.used < self.limit:
+            return 0.0
+        next_day = datetime.combine(
+            self._day + timedelta(days=1), time.min, tzinfo=dt_util.UTC
+        )
+        return (next_day - now).total_seconds()
+
+    def consume(self) -> None:
+        """Count one request."""
+        self._roll()
+        self.used += 1
+
+
+class CircuitBreaker:
+    """Stop sending requests while setlist.fm is down.
+
+    After BREAKER_THRESHOLD consecutive failures the breaker opens and
+    requests are refused until the reset timeout has passed. The next request
+    is then let through as a probe; if it fails too, the breaker opens again
+    with the timeout doubled (up to BREAKER_MAX_RESET_TIMEOUT).
+    """
+
+    def __init__(self) -> None:
+        """Initialize a closed breaker."""
+        self.failures = 0
+        self._reset_timeout = BREAKER_RESET_TIMEOUT
+        self._open_until: float | None = None
+
+    @property
+    def is_open(self) -> bool:
+        """Return True while requests are being refused."""
+        return self._open_until is not None and monotonic() < self._open_until
+
+    def allow(self) -> bool:
+        """Return whether a request may be sent."""
+        return not self.is_open
+
+    def record_success(self) -> None:
+        """Close the breaker after setlist.fm answered."""
+        self.failures = 0
+        self._reset_timeout = BREAKER_RESET_TIMEOUT
+        self._open_until = None
+
+    def record_failure(self) -> None:
+        """Count a failed request, opening the breaker at the threshold."""
+        self.failures += 1
+        if self.failures < BREAKER_THRESHOLD:
+            return
+        if self._open_until is not None:
+            # The probe failed as well
+            self._reset_timeout = min(
+                self._reset_timeout * 2, BREAKER_MAX_RESET_TIMEOUT
+            )
+        self._open_until = monotonic() + self._reset_timeout
+        _LOGGER.warning(
+            "setlist.fm failed %d times in a row, pausing requests for %d seconds",
+            self.failures,
+            self._reset_timeout,
+        )
+
+
+class RequestScheduler:
+    """Hand out request slots for one API key, highest priority first.
+
+    Every request to setlist.fm waits for a slot, so entries sharing a key
+    stay within the per-second and per-day limits together instead of each
+    tripping 429s on its own schedule.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        rate: float = RATE_LIMIT_PER_SECOND,
+        daily_limit: int = RATE_LIMIT_PER_DAY,
+    ) -> None:
+        """Initialize the scheduler."""
+        self._hass = hass
+        self._limits: tuple[TokenBucket | DailyQuota, ...] = (
+            TokenBucket(rate, 1),
+            DailyQuota(daily_limit),
+        )
+        self._queue: list[tuple[int, int, asyncio.Future[None]]] = []
+        self._seq = itertools.count()
+        self._paused_until = 0.0
+        self._dispatcher: asyncio.Task | None = None
+        self.breaker = CircuitBreaker()
+
+    async def async_acquire(self, priority: int = PRIORITY_POLL) -> None:
+        """Wait until a request may be sent."""
+        future: asyncio.Future[None] = self._hass.loop.create_future()
+        heapq.heappush(self._queue, (priority, next(self._seq), future))
+        if self._dispatcher is None or self._dispatcher.done():
+            self._dispatcher = self._hass.async_create_background_task(
+                self._async_dispatch(), "setlistfm request scheduler"
+            )
+        await future
+
+    def pause(self, seconds: float) -> None:
+        """Hold back every queued request, e.g. after setlist.fm answered 429."""
+        self._paused_until = max(self._paused_until, monotonic() + seconds)
+
+    async def _async_dispatch(self) -> None:
+        """Release queued requests as tokens become available."""
+        while self._queue:
+            delay = max(
+                self._paused_until - monotonic(),
+                *(limit.delay() for limit in self._limits),
+            )
+            if delay > 0:
+                await asyncio.sleep(delay)
+                continue
+
+            _, _, future = heapq.heappop(self._queue)
+            if future.done():
+                # The waiter was cancelled while queued
+                continue
+            for limit in self._limits:
+                limit.consume()
+            future.set_result(None)
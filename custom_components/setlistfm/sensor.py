@@ -1,29 +1,49 @@
 """Sensor platform for setlist.fm integration."""
 from __future__ import annotations
 
-from datetime import datetime
+from collections.abc import Callable
+from dataclasses import dataclass
 import logging
+from typing import Any
 
-from homeassistant.components.sensor import SensorEntity, SensorStateClass
-from homeassistant.const import ATTR_ATTRIBUTION
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorEntityDescription,
+    SensorStateClass,
+)
+from homeassistant.const import (
+    PERCENTAGE,
+    EntityCategory,
+    UnitOfTime,
+)
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.device_registry import DeviceEntryType
-from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.util import dt as dt_util
 
-from . import SetlistFmCoordinator
+from . import SetlistFmCoordinator, async_get_household
+from .entity import SetlistFmEntity, device_info, entry_name
+from .household import Household
+from .metrics import FetchMetrics
+from .models import Concert, ConcertIndex
+from .stats import ConcertStats, top
 from .const import (
     DOMAIN,
-    CONF_NAME,
+    ATTRIBUTION,
     CONF_NUMBER_OF_CONCERTS,
     CONF_DATE_FORMAT,
     CONF_SHOW_CONCERTS,
+    CONF_RECORD_CONCERTS,
     DEFAULT_NUMBER_OF_CONCERTS,
     DEFAULT_DATE_FORMAT,
     DEFAULT_SHOW_CONCERTS,
+    DEFAULT_RECORD_CONCERTS,
+    STATS_TOP_N,
+    HOUSEHOLD_TOGETHER_LIMIT,
+    SIGNAL_METRICS_UPDATED,
+    SIGNAL_HOUSEHOLD_UPDATED,
 )
 
 _LOGGER = logging.getLogger(__name__)
@@ -36,6 +56,140 @@ _ON = "on"
 _UPCOMING = "Upcoming"
 
 
+@dataclass(frozen=True, kw_only=True)
+class SetlistFmStatsSensorEntityDescription(SensorEntityDescription):
+    """Describes a setlist.fm statistics sensor."""
+
+    value_fn: Callable[[ConcertStats], Any]
+    attrs_fn: Callable[[ConcertStats], dict[str, Any]] | None = None
+
+
+@dataclass(frozen=True, kw_only=True)
+class SetlistFmMetricsSensorEntityDescription(SensorEntityDescription):
+    """Describes a setlist.fm diagnostic sensor."""
+
+    value_fn: Callable[[FetchMetrics], Any]
+    attrs_fn: Callable[[FetchMetrics], dict[str, Any]] | None = None
+
+
+def _top_sensor(
+    key: str, name: str, icon: str, counter: Callable[[ConcertStats], Any]
+) -> SetlistFmStatsSensorEntityDescription:
+    """Describe a sensor showing the most frequent entry of a counter."""
+    return SetlistFmStatsSensorEntityDescription(
+        key=key,
+        name=name,
+        icon=icon,
+        value_fn=lambda stats: next(iter(top(counter(stats), 1)), {}).get("name"),
+        attrs_fn=lambda stats: {"top": top(counter(stats), STATS_TOP_N)},
+    )
+
+
+STATS_SENSORS: tuple[SetlistFmStatsSensorEntityDescription, ...] = (
+    SetlistFmStatsSensorEntityDescription(
+        key="total_shows",
+        name="Total Shows",
+        icon="mdi:ticket",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda stats: stats.total_shows,
+    ),
+    SetlistFmStatsSensorEntityDescription(
+        key="distinct_artists",
+        name="Distinct Artists",
+        icon="mdi:account-music",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda stats: len(stats.artists),
+    ),
+    SetlistFmStatsSensorEntityDescription(
+        key="total_songs",
+        name="Total Songs",
+        icon="mdi:playlist-music",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda stats: stats.total_songs,
+    ),
+    SetlistFmStatsSensorEntityDescription(
+        key="shows_this_year",
+        name="Shows This Year",
+        icon="mdi:calendar-star",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda stats: stats.years.get(dt_util.now().year, 0),
+        attrs_fn=lambda stats: {
+            "shows_per_year": {
+                str(year): stats.years[year] for year in sorted(stats.years)
+            }
+        },
+    ),
+    _top_sensor("top_artist", "Top Artist", "mdi:star", lambda s: s.artists),
+    _top_sensor("top_venue", "Top Venue", "mdi:stadium", lambda s: s.venues),
+    _top_sensor("top_city", "Top City", "mdi:city", lambda s: s.cities),
+    _top_sensor("top_country", "Top Country", "mdi:earth", lambda s: s.countries),
+)
+
+METRICS_SENSORS: tuple[SetlistFmMetricsSensorEntityDescription, ...] = (
+    SetlistFmMetricsSensorEntityDescription(
+        key="request_latency",
+        name="Request Latency",
+        icon="mdi:timer-outline",
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda metrics: (
+            metrics.latency_percentiles("attended") or {}
+        ).get("p90"),
+        attrs_fn=lambda metrics: {
+            endpoint: metrics.latency_percentiles(endpoint)
+            for endpoint in metrics.latencies
+        },
+    ),
+    SetlistFmMetricsSensorEntityDescription(
+        key="api_requests",
+        name="API Requests",
+        icon="mdi:api",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda metrics: metrics.requests,
+        attrs_fn=lambda metrics: {
+            "retries": metrics.retries,
+            "rate_limited": metrics.rate_limited,
+            "bytes_downloaded": metrics.bytes_downloaded,
+        },
+    ),
+    SetlistFmMetricsSensorEntityDescription(
+        key="cache_hit_rate",
+        name="Cache Hit Rate",
+        icon="mdi:cached",
+        native_unit_of_measurement=PERCENTAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda metrics: (
+            None
+            if metrics.cache_hit_rate is None
+            else round(100 * metrics.cache_hit_rate, 1)
+        ),
+    ),
+    SetlistFmMetricsSensorEntityDescription(
+        key="sync_duration",
+        name="Sync Duration",
+        icon="mdi:timer-sand",
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda metrics: (
+            None
+            if metrics.last_sync_duration is None
+            else round(metrics.last_sync_duration, 3)
+        ),
+        attrs_fn=lambda metrics: {
+            "decode_time": round(metrics.decode_time, 3),
+            "normalize_time": round(metrics.normalize_time, 3),
+            "failed_syncs": metrics.failed_syncs,
+        },
+    ),
+    SetlistFmMetricsSensorEntityDescription(
+        key="last_successful_sync",
+        name="Last Successful Sync",
+        device_class=SensorDeviceClass.TIMESTAMP,
+        value_fn=lambda metrics: metrics.last_success,
+    ),
+)
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
@@ -44,24 +198,38 @@ async def async_setup_entry(
     """Set up setlist.fm sensors based on a config entry."""
     coordinator: SetlistFmCoordinator = hass.data[DOMAIN][entry.entry_id]
 
-    entities = [
-        SetlistFmConcertsSensor(coordinator, entry),
+    if entry.options.get(CONF_RECORD_CONCERTS, DEFAULT_RECORD_CONCERTS):
+        concerts_sensor = SetlistFmConcertsSensor(coordinator, entry)
+    else:
+        concerts_sensor = SetlistFmUnrecordedConcertsSensor(coordinator, entry)
+
+    entities: list[SensorEntity] = [
+        concerts_sensor,
     ]
+    entities.extend(
+        SetlistFmStatsSensor(coordinator, entry, description)
+        for description in STATS_SENSORS
+    )
+    entities.extend(
+        SetlistFmMetricsSensor(coordinator, entry, description)
+        for description in METRICS_SENSORS
+    )
+    if coordinator.watchlist:
+        entities.append(SetlistFmWatchlistSensor(coordinator, entry))
 
     async_add_entities(entities)
 
-
-def _device_info(entry: ConfigEntry) -> DeviceInfo:
-    """Shared device info for all setlist.fm sensors belonging to this entry."""
-    return DeviceInfo(
-        identifiers={(DOMAIN, entry.entry_id)},
-        name=entry.data.get(CONF_NAME, entry.data.get("userid", entry.title)),
-        manufacturer="setlist.fm",
-        entry_type=DeviceEntryType.SERVICE,
+    # With several users configured, one of the entries holds the household sensor
+    household = async_get_household(hass)
+    entry.async_on_unload(
+        household.async_add_sensor_platform(
+            entry.entry_id,
+            lambda: async_add_entities([SetlistFmHouseholdSensor(household)]),
+        )
     )
 
 
-class SetlistFmConcertsSensor(CoordinatorEntity, SensorEntity):
+class SetlistFmConcertsSensor(SetlistFmEntity, SensorEntity):
     """Representation of a setlist.fm concerts sensor."""
 
     _attr_icon = "mdi:music-note"
@@ -73,20 +241,26 @@ class SetlistFmConcertsSensor(CoordinatorEntity, SensorEntity):
         entry: ConfigEntry,
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, entry, "concerts", "Concerts")
         self._entry = entry
         self._userid = entry.data["userid"]
-        self._attr_name = f"{entry.data.get(CONF_NAME, entry.data['userid'])} Concerts"
-        self._attr_unique_id = f"{entry.entry_id}_concerts"
-        self._attr_device_info = _device_info(entry)
-        self._last_update_time = dt_util.now()
+        # Rendered attributes, reused until the data, options or local date change
+        self._data_generation = 0
+        self._render_key: tuple | None = None
+        self._rendered: tuple[list[Concert], list[dict], str] = ([], [], "")
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Invalidate rendered attributes when new data arrives."""
+        self._data_generation += 1
+        super()._handle_coordinator_update()
 
     @property
     def native_value(self) -> int:
         """Return the number of concerts."""
         if self.coordinator.data is None:
             return 0
-        return len(self._get_filtered_concerts())
+        return len(self._render()[0])
 
     @property
     def extra_state_attributes(self) -> dict:
@@ -94,102 +268,61 @@ class SetlistFmConcertsSensor(CoordinatorEntity, SensorEntity):
         if self.coordinator.data is None:
             return {}
 
-        if self.coordinator.last_update_success:
-            self._last_update_time = dt_util.now()
-
-        concerts = self._get_filtered_concerts()
-        concert_lines = self._format_concerts(concerts)
-
-        simplified_concerts = []
-        for concert in concerts:
-            try:
-                artist_name = concert.get("artist", {}).get("name", "Unknown")
-                venue_name = concert.get("venue", {}).get("name", "Unknown")
-                city_name = concert.get("venue", {}).get("city", {}).get("name", "")
-                state = concert.get("venue", {}).get("city", {}).get("state", "")
-                country = concert.get("venue", {}).get("city", {}).get("country", {}).get("name", "")
-
-                song_count = 0
-                sets = concert.get("sets", {}).get("set", [])
-                for set_item in sets:
-                    song_count += len(set_item.get("song", []))
-
-                simplified_concerts.append({
-                    "id": concert.get("id"),
-                    "date": concert.get("eventDate"),
-                    "artist": {
-                        "name": artist_name,
-                        "mbid": concert.get("artist", {}).get("mbid"),
-                    },
-                    "venue": {
-                        "name": venue_name,
-                        "city": city_name,
-                        "state": state,
-                        "country": country,
-                    },
-                    "song_count": song_count,
-                    "url": concert.get("url", ""),
-                })
-            except (KeyError, ValueError, TypeError) as err:
-                _LOGGER.warning("Error simplifying concert data: %s", err)
-                continue
+        _, simplified_concerts, concert_list = self._render()
 
         attrs = {
-            ATTR_ATTRIBUTION: "Data provided by setlist.fm (https://www.setlist.fm)",
             "concerts": simplified_concerts,
-            "concert_list": "\n".join(concert_lines),
-            "last_updated": self._last_update_time,
+            "concert_list": concert_list,
+            "last_updated": self.coordinator.last_fetched,
             "last_update_success": self.coordinator.last_update_success,
         }
         if self.coordinator.last_exception:
             attrs["last_error"] = str(self.coordinator.last_exception)
         return attrs
 
-    def _get_filtered_concerts(self) -> list:
+    def _render(self) -> tuple[list[Concert], list[dict], str]:
+        """Return filtered concerts and their rendered forms, memoized."""
+        options = self._entry.options
+        key = (
+            self._data_generation,
+            options.get(CONF_SHOW_CONCERTS, DEFAULT_SHOW_CONCERTS),
+            options.get(CONF_NUMBER_OF_CONCERTS, DEFAULT_NUMBER_OF_CONCERTS),
+            options.get(CONF_DATE_FORMAT, DEFAULT_DATE_FORMAT),
+            # Shows move between upcoming and past when the local date rolls over
+            dt_util.now().date(),
+        )
+        if key != self._render_key:
+            concerts = self._get_filtered_concerts()
+            self._rendered = (
+                concerts,
+                [concert.as_dict() for concert in concerts],
+                "\n".join(self._format_concerts(concerts)),
+            )
+            self._render_key = key
+        return self._rendered
+
+    def _get_filtered_concerts(self) -> list[Concert]:
         """Get filtered and sorted concerts based on options."""
         if self.coordinator.data is None:
             return []
 
-        concerts = self.coordinator.data.get("concerts", [])
+        index: ConcertIndex = self.coordinator.data["index"]
         options = self._entry.options
 
         show_concerts = options.get(CONF_SHOW_CONCERTS, DEFAULT_SHOW_CONCERTS)
         number_of_concerts = options.get(CONF_NUMBER_OF_CONCERTS, DEFAULT_NUMBER_OF_CONCERTS)
 
-        try:
-            concerts_sorted = sorted(
-                concerts,
-                key=lambda x: datetime.strptime(x["eventDate"], "%d-%m-%Y"),
-                reverse=True,
-            )
-        except (KeyError, ValueError) as err:
-            _LOGGER.error("Error sorting concerts: %s", err)
-            return []
+        # The index is sorted newest first with ready-made views; just slice
+        if show_concerts == "upcoming":
+            concerts = index.upcoming(dt_util.now().date())
+        elif show_concerts == "past":
+            concerts = index.past(dt_util.now().date())
+        else:
+            concerts = index.concerts
 
-        now = dt_util.now().date()
-        filtered = []
+        return concerts[:number_of_concerts]
 
-        for concert in concerts_sorted:
-            try:
-                event_date = datetime.strptime(concert["eventDate"], "%d-%m-%Y").date()
-
-                if show_concerts == "upcoming" and event_date >= now:
-                    filtered.append(concert)
-                elif show_concerts == "past" and event_date < now:
-                    filtered.append(concert)
-                elif show_concerts == "all":
-                    filtered.append(concert)
-
-                if len(filtered) >= number_of_concerts:
-                    break
-
-            except (KeyError, ValueError) as err:
-                _LOGGER.warning("Error processing concert: %s", err)
-                continue
-
-        return filtered
-
-    def _format_concerts(self, concerts: list) -> list:
+    def _format_concerts(self, concerts: list[Concert]) -> list:
         """Format concerts into readable strings."""
         options = self._entry.options
         date_format = options.get(CONF_DATE_FORMAT, DEFAULT_DATE_FORMAT)
@@ -197,25 +330,187 @@ class SetlistFmConcertsSensor(CoordinatorEntity, SensorEntity):
 
         lines = []
         for concert in concerts:
-            try:
-                event_date = datetime.strptime(concert["eventDate"], "%d-%m-%Y").date()
-                formatted_date = event_date.strftime(date_format)
+            artist_name = concert.artist.name or "Unknown Artist"
+            venue_name = concert.venue.name or "Unknown Venue"
 
-                artist_name = concert.get("artist", {}).get("name", "Unknown Artist")
-                venue_name = concert.get("venue", {}).get("name", "Unknown Venue")
-                city_name = concert.get("venue", {}).get("city", {}).get("name", "")
+            line = f"{artist_name} {_AT} {venue_name}"
+            if concert.venue.city:
+                line += f" {_IN} {concert.venue.city}"
+            line += f" {_ON} {concert.date.strftime(date_format)}"
+            if concert.date > now:
+                line += f" ({_UPCOMING})"
 
-                line = f"{artist_name} {_AT} {venue_name}"
-                if city_name:
-                    line += f" {_IN} {city_name}"
-                line += f" {_ON} {formatted_date}"
-                if event_date > now:
-                    line += f" ({_UPCOMING})"
+            lines.append(line)
 
-                lines.append(line)
+        return lines
 
-            except (KeyError, ValueError) as err:
-                _LOGGER.warning("Error formatting concert: %s", err)
-                continue
 
-        return lines
+class SetlistFmUnrecordedConcertsSensor(SetlistFmConcertsSensor):
+    """Concerts sensor whose bulky attributes are kept out of the recorder.
+
+    The full list is still available through the setlistfm.get_concerts service.
+    """
+
+    _unrecorded_attributes = frozenset({"concerts", "concert_list"})
+
+
+class SetlistFmStatsSensor(SetlistFmEntity, SensorEntity):
+    """A statistic over the user's whole attended history.
+
+    The aggregates are kept up to date by the history as setlists are
+    synced, so reading them never scans the concerts.
+    """
+
+    entity_description: SetlistFmStatsSensorEntityDescription
+
+    def __init__(
+        self,
+        coordinator: SetlistFmCoordinator,
+        entry: ConfigEntry,
+        description: SetlistFmStatsSensorEntityDescription,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator, entry, description.key, description.name)
+        self.entity_description = description
+
+    @property
+    def native_value(self) -> Any:
+        """Return the statistic."""
+        if self.coordinator.data is None:
+            return None
+        return self.entity_description.value_fn(self.coordinator.data["stats"])
+
+    @property
+    def extra_state_attributes(self) -> dict | None:
+        """Return the breakdown behind the statistic, if any."""
+        if self.coordinator.data is None or self.entity_description.attrs_fn is None:
+            return None
+        return self.entity_description.attrs_fn(self.coordinator.data["stats"])
+
+
+class SetlistFmWatchlistSensor(SetlistFmEntity, SensorEntity):
+    """Upcoming shows and latest setlists of the watched artists."""
+
+    _attr_icon = "mdi:account-star"
+    _unrecorded_attributes = frozenset({"artists"})
+
+    def __init__(self, coordinator: SetlistFmCoordinator, entry: ConfigEntry) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator, entry, "watched_artists", "Watched Artists")
+
+    @property
+    def native_value(self) -> int | None:
+        """Return the number of upcoming shows of the watched artists."""
+        if self.coordinator.data is None:
+            return None
+        return sum(
+            len(artist.upcoming) for artist in self.coordinator.data["watchlist"]
+        )
+
+    @property
+    def extra_state_attributes(self) -> dict | None:
+        """Return each watched artist's latest setlist and upcoming shows."""
+        if self.coordinator.data is None:
+            return None
+        return {
+            "artists": [
+                artist.as_dict() for artist in self.coordinator.data["watchlist"]
+            ],
+        }
+
+
+class SetlistFmMetricsSensor(SensorEntity):
+    """Runtime metrics of an entry's fetch pipeline, disabled by default.
+
+    Updated after every refresh attempt, including those that found no
+    changes and so don't notify coordinator entities.
+    """
+
+    _attr_should_poll = False
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+    entity_description: SetlistFmMetricsSensorEntityDescription
+
+    def __init__(
+        self,
+        coordinator: SetlistFmCoordinator,
+        entry: ConfigEntry,
+        description: SetlistFmMetricsSensorEntityDescription,
+    ) -> None:
+        """Initialize the sensor."""
+        self.entity_description = description
+        self._metrics = coordinator.client.metrics
+        self._entry_id = entry.entry_id
+        self._attr_name = f"{entry_name(entry)} {description.name}"
+        self._attr_unique_id = f"{entry.entry_id}_{description.key}"
+        self._attr_device_info = device_info(entry)
+
+    async def async_added_to_hass(self) -> None:
+        """Follow metric updates."""
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass,
+                SIGNAL_METRICS_UPDATED.format(self._entry_id),
+                self.async_write_ha_state,
+            )
+        )
+
+    @property
+    def native_value(self) -> Any:
+        """Return the metric."""
+        return self.entity_description.value_fn(self._metrics)
+
+    @property
+    def extra_state_attributes(self) -> dict | None:
+        """Return the metric's breakdown, if any."""
+        if self.entity_description.attrs_fn is None:
+            return None
+        return self.entity_description.attrs_fn(self._metrics)
+
+
+class SetlistFmHouseholdSensor(SensorEntity):
+    """Shows attended by any of the configured users, counted once each."""
+
+    _attr_attribution = ATTRIBUTION
+    _attr_icon = "mdi:home-group"
+    _attr_name = "Setlist.fm Household"
+    _attr_unique_id = f"{DOMAIN}_household"
+    _attr_should_poll = False
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _unrecorded_attributes = frozenset({"shows_together"})
+
+    def __init__(self, household: Household) -> None:
+        """Initialize the sensor."""
+        self._household = household
+
+    async def async_added_to_hass(self) -> None:
+        """Follow changes to any member's history."""
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass, SIGNAL_HOUSEHOLD_UPDATED, self.async_write_ha_state
+            )
+        )
+
+    @property
+    def native_value(self) -> int:
+        """Return the number of distinct shows attended by the household."""
+        return len(self._household.concerts)
+
+    @property
+    def extra_state_attributes(self) -> dict:
+        """Return per-member counts, household totals and shared shows."""
+        household = self._household
+        return {
+            "members": {
+                name: household.member_shows(entry_id)
+                for entry_id, name in household.names.items()
+            },
+            "total_shows_together": len(household.together),
+            "distinct_artists": len(household.stats.artists),
+            "total_songs": household.stats.total_songs,
+            "top_artists": top(household.stats.artists, STATS_TOP_N),
+            "shows_together": [
+                {**concert.as_dict(), "attendees": household.attendees(concert.id)}
+                for concert in household.shows_together(HOUSEHOLD_TOGETHER_LIMIT)
+            ],
+        }
@@ -0,0 +1,108 @@
+"""Index of the songs heard across a user's attended history."""
+from __future__ import annotations
+
+from bisect import bisect_left, insort
+from typing import Any
+
+from .models import Concert
+
+
+class SongIndex:
+    """Map each song (per artist) to the shows it was played at.
+
+    Keys are ``(song, artist)`` pairs, casefolded, kept in a sorted list so
+    that exact and prefix lookups are a binary search followed by a short
+    scan. Like the statistics, the index is updated one concert at a time
+    as the history changes.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty index."""
+        self._keys: list[tuple[str, str]] = []
+        self._shows: dict[tuple[str, str], dict[str, Concert]] = {}
+        self._names: dict[tuple[str, str], tuple[str, str]] = {}
+
+    def __len__(self) -> int:
+        """Return the number of distinct songs."""
+        return len(self._keys)
+
+    def add(self, concert: Concert) -> None:
+        """Index the songs of a concert."""
+        for key, names in _song_keys(concert).items():
+            if (shows := self._shows.get(key)) is None:
+                shows = self._shows[key] = {}
+                self._names[key] = names
+                insort(self._keys, key)
+            shows[concert.id] = concert
+
+    def remove(self, concert: Concert) -> None:
+        """Drop the songs of a concert from the index."""
+        for key in _song_keys(concert):
+            if (shows := self._shows.get(key)) is None:
+                continue
+            shows.pop(concert.id, None)
+            if not shows:
+                del self._shows[key]
+                del self._names[key]
+                del self._keys[bisect_left(self._keys, key)]
+
+    def search(
+        self,
+        query: str,
+        prefix: bool = False,
+        artist: str | None = None,
+        limit: int | None = None,
+    ) -> list[dict[str, Any]]:
+        """Return matching songs with the shows they were heard at.
+
+        Matching is case-insensitive; with ``prefix`` every song starting
+        with the query matches, otherwise only the song itself.
+        """
+        query = query.casefold()
+        wanted_artist = artist.casefold() if artist else None
+
+        results: list[dict[str, Any]] = []
+        for position in range(bisect_left(self._keys, (query,)), len(self._keys)):
+            key = self._keys[position]
+            song = key[0]
+            if song != query and not (prefix and song.startswith(query)):
+                break
+            if wanted_artist is not None and key[1] != wanted_artist:
+                continue
+            if limit is not None and len(results) >= limit:
+                break
+
+            shows = sorted(
+                self._shows[key].values(),
+                key=lambda concert: concert.date,
+                reverse=True,
+            )
+            name, artist_name = self._names[key]
+            results.append(
+                {
+                    "song": name,
+                    "artist": artist_name,
+                    "times_heard": len(shows),
+                    "shows": [
+                        {
+                            "id": concert.id,
+                            "date": concert.event_date,
+                            "venue": concert.venue.name or "Unknown",
+                            "city": concert.venue.city,
+                            "url": concert.url,
+                        }
+                        for concert in shows
+                    ],
+                }
+            )
+        return results
+
+
+def _song_keys(concert: Concert) -> dict[tuple[str, str], tuple[str, str]]:
+    """Return the index keys of a concert's songs, with their display names."""
+    artist = concert.artist.name or "Unknown"
+    return {
+        (song.casefold(), artist.casefold()): (song, artist)
+        for song in concert.songs or ()
+        if song
+    }
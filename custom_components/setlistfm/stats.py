@@ -0,0 +1,69 @@
+"""Running statistics over a user's attended history."""
+from __future__ import annotations
+
+from collections import Counter
+from typing import Any
+
+from .models import Concert
+
+
+class ConcertStats:
+    """Aggregates kept up to date one concert at a time.
+
+    The history adds and removes concerts as a sync changes them, so a
+    refresh costs time in proportion to what changed, not to the size of
+    the history.
+    """
+
+    def __init__(self) -> None:
+        """Initialize empty statistics."""
+        self.total_shows = 0
+        self.total_songs = 0
+        self.artists: Counter[str] = Counter()
+        self.venues: Counter[tuple[str, str]] = Counter()
+        self.cities: Counter[tuple[str, str]] = Counter()
+        self.countries: Counter[str] = Counter()
+        self.years: Counter[int] = Counter()
+
+    def add(self, concert: Concert) -> None:
+        """Count a concert."""
+        self._apply(concert, 1)
+
+    def remove(self, concert: Concert) -> None:
+        """Stop counting a concert."""
+        self._apply(concert, -1)
+
+    def _apply(self, concert: Concert, delta: int) -> None:
+        venue = concert.venue
+        self.total_shows += delta
+        self.total_songs += delta * concert.song_count
+
+        _count(self.artists, concert.artist.name or "Unknown", delta)
+        _count(self.venues, (venue.name or "Unknown", venue.city), delta)
+        _count(self.years, concert.date.year, delta)
+        if venue.city:
+            _count(self.cities, (venue.city, venue.country), delta)
+        if venue.country:
+            _count(self.countries, venue.country, delta)
+
+
+def _count(counter: Counter, key: Any, delta: int) -> None:
+    """Adjust a counter, dropping keys that reach zero."""
+    counter[key] += delta
+    if counter[key] <= 0:
+        del counter[key]
+
+
+def top(counter: Counter, count: int) -> list[dict[str, Any]]:
+    """Return the most frequent entries of a counter as attribute-friendly dicts."""
+    return [
+        {"name": _label(key), "count": value}
+        for key, value in counter.most_common(count)
+    ]
+
+
+def _label(key: Any) -> Any:
+    """Join (name, place) keys into a single display string."""
+    if isinstance(key, tuple):
+        return ", ".join(part for part in key if part)
+    return key
@@ -0,0 +1,119 @@
+"""On-disk cache of synced setlist.fm data."""
+from __future__ import annotations
+
+from datetime import datetime
+import logging
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN
+from .models import Concert
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 2
+STORAGE_MINOR_VERSION = 1
+STORAGE_KEY = f"{DOMAIN}.{{entry_id}}"
+
+# Delay writes so a burst of refreshes results in a single disk write
+SAVE_DELAY = 10
+
+# Only the newest concerts are cached; anything older is fetched again on sync
+MAX_CACHED_CONCERTS = 10000
+
+
+class _SetlistFmStore(Store[dict[str, Any]]):
+    """Store that knows how to upgrade older cache layouts."""
+
+    async def _async_migrate_func(
+        self,
+        old_major_version: int,
+        old_minor_version: int,
+        old_data: dict[str, Any],
+    ) -> dict[str, Any]:
+        """Migrate the cache to the current layout."""
+        if old_major_version == STORAGE_VERSION:
+            # Minor versions only ever add optional keys
+            return old_data
+        if old_major_version == 1:
+            # Version 1 cached API-shaped setlists; convert them to the
+            # compact concert layout
+            concerts = []
+            for setlist in old_data.get("setlists", []):
+                try:
+                    concerts.append(Concert.from_setlist(setlist, keep_songs=True))
+                except (KeyError, ValueError, TypeError, AttributeError):
+                    continue
+            return {
+                "synced_at": old_data.get("synced_at"),
+                "user": old_data.get("user", {}),
+                "concerts": [concert.to_cached() for concert in concerts],
+            }
+        # The cache can always be rebuilt from the API, so unknown layouts are
+        # dropped rather than converted.
+        _LOGGER.debug(
+            "Discarding setlist.fm cache with unsupported version %s.%s",
+            old_major_version,
+            old_minor_version,
+        )
+        return {}
+
+
+class SetlistCache:
+    """Persist the user profile and attended concerts of one config entry."""
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize the cache."""
+        self._store = _SetlistFmStore(
+            hass,
+            STORAGE_VERSION,
+            STORAGE_KEY.format(entry_id=entry_id),
+            minor_version=STORAGE_MINOR_VERSION,
+        )
+        self._pending: tuple[dict[str, Any], list[Concert], datetime] | None = None
+
+    async def async_load(
+        self,
+    ) -> tuple[dict[str, Any], list[Concert], datetime | None] | None:
+        """Load the cached user, concerts and the time they were fetched.
+
+        Returns None if nothing usable is stored.
+        """
+        try:
+            data = await self._store.async_load()
+            if not data or "concerts" not in data:
+                return None
+            concerts = [Concert.from_cached(item) for item in data["concerts"]]
+            synced_at = data.get("synced_at")
+            fetched = dt_util.parse_datetime(synced_at) if synced_at else None
+        except Exception as err:  # pylint: disable=broad-except
+            _LOGGER.warning("Ignoring unreadable setlist.fm cache: %s", err)
+            return None
+        return data.get("user", {}), concerts, fetched
+
+    @callback
+    def async_schedule_save(
+        self, user: dict[str, Any], concerts: list[Concert], fetched: datetime
+    ) -> None:
+        """Schedule a (delayed) write of data fetched at the given time."""
+        self._pending = (user, concerts, fetched)
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    async def async_remove(self) -> None:
+        """Delete the cache file."""
+        await self._store.async_remove()
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Build the compact payload written to disk."""
+        user, concerts, fetched = self._pending or ({}, [], dt_util.utcnow())
+        return {
+            "synced_at": dt_util.as_utc(fetched).isoformat(),
+            "user": user,
+            "concerts": [
+                concert.to_cached() for concert in concerts[:MAX_CACHED_CONCERTS]
+            ],
+        }
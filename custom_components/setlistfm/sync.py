@@ -0,0 +1,200 @@
+"""Incremental sync of a user's attended setlist history."""
+from __future__ import annotations
+
+import logging
+from time import monotonic
+from typing import Any
+
+from .api import SetlistFmClient, SetlistFmNotFoundError
+from .models import Concert
+from .scheduler import PRIORITY_POLL
+from .songs import SongIndex
+from .stats import ConcertStats
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class AttendedHistory:
+    """The full attended history of one user, kept newest first.
+
+    setlist.fm pages ``/user/{id}/attended`` 20 items at a time, newest first.
+    The first sync walks every page; later syncs stop at the first page that
+    contains a setlist we already have, as long as the merged history then
+    matches the ``total`` reported by the API. A mismatch means shows were
+    added further down (e.g. an old gig marked as attended) or removed, and
+    falls back to a full walk.
+
+    Setlists are converted to compact Concert records as each page arrives,
+    so the raw payloads never outlive the request that fetched them. The
+    statistics and the song index are updated from the concerts a sync
+    actually changed.
+    """
+
+    def __init__(self, keep_songs: bool = False) -> None:
+        """Initialize an empty history."""
+        self.concerts: list[Concert] = []
+        self.keep_songs = keep_songs
+        self.stats = ConcertStats()
+        self.songs = SongIndex()
+        self._by_id: dict[str, Concert] = {}
+        self._resync = False
+        # Time spent turning payloads into concerts during the last sync
+        self.normalize_time = 0.0
+        # Includes setlists that could not be ingested, so they still count
+        # towards the total reported by the API
+        self._ids: set[str] = set()
+
+    def restore(self, concerts: list[Concert]) -> None:
+        """Seed the history from previously cached concerts."""
+        self.concerts = list(concerts)
+        self._ids = {concert.id for concert in self.concerts if concert.id}
+        self._by_id = {concert.id: concert for concert in self.concerts if concert.id}
+        self.stats = ConcertStats()
+        self.songs = SongIndex()
+        for concert in self.concerts:
+            self._add(concert)
+        # Caches written without song names can't fill the song index
+        self._resync = self.keep_songs and any(
+            concert.songs is None for concert in self.concerts
+        )
+
+    def clear(self) -> bool:
+        """Empty the history, e.g. after the user cleared their attended list.
+
+        Returns False if it was empty already.
+        """
+        if not self._by_id:
+            return False
+        for concert in self._by_id.values():
+            self._remove(concert)
+        self.concerts = []
+        self._ids = set()
+        self._by_id = {}
+        self._resync = False
+        return True
+
+    def seed(self, data: dict[str, Any]) -> bool:
+        """Start the history from a first attended page fetched elsewhere.
+
+        Returns True if the page held the whole history.
+        """
+        concerts = []
+        setlist_ids = set()
+        for item in data.get("setlist", []):
+            if (setlist_id := item.get("id")) is None:
+                continue
+            setlist_ids.add(setlist_id)
+            try:
+                concerts.append(Concert.from_setlist(item, self.keep_songs))
+            except (KeyError, ValueError, TypeError, AttributeError) as err:
+                _LOGGER.warning("Error processing concert %s: %s", setlist_id, err)
+        self.restore(concerts)
+        self._ids |= setlist_ids
+        return len(self._ids) >= int(data.get("total", 0))
+
+    async def async_sync(
+        self, client: SetlistFmClient, userid: str, priority: int = PRIORITY_POLL
+    ) -> bool:
+        """Bring the history up to date; return False if nothing changed."""
+        fetched: list[Concert] = []
+        fetched_ids: set[str] = set()
+        full_walk = not self.concerts or self._resync
+        complete = False
+        page = 1
+        self.normalize_time = 0.0
+
+        while True:
+            try:
+                # An unchanged first page (including its total) means an
+                # unchanged history, so page 1 is fetched conditionally
+                data = await client.async_get_attended_page(
+                    userid, page, priority, conditional=page == 1 and not self._resync
+                )
+            except SetlistFmNotFoundError:
+                # setlist.fm answers 404 for an empty result page, but a 404 on
+                # page 1 of a known history may also mean the user was renamed
+                # or deleted; leave it to the caller to tell which it was
+                if page == 1 and self._by_id:
+                    raise
+                complete = True
+                break
+
+            if data is None:
+                _LOGGER.debug("Attended history of %s is unchanged", userid)
+                return False
+
+            items = data.get("setlist", [])
+            total = int(data.get("total", 0))
+            per_page = int(data.get("itemsPerPage", 0)) or len(items) or 1
+
+            overlap = False
+            started = monotonic()
+            for item in items:
+                setlist_id = item.get("id")
+                if setlist_id is None or setlist_id in fetched_ids:
+                    # Pages can shift while we walk them; never keep duplicates
+                    continue
+                fetched_ids.add(setlist_id)
+                if setlist_id in self._ids:
+                    overlap = True
+                try:
+                    fetched.append(Concert.from_setlist(item, self.keep_songs))
+                except (KeyError, ValueError, TypeError, AttributeError) as err:
+                    _LOGGER.warning("Error processing concert %s: %s", setlist_id, err)
+            self.normalize_time += monotonic() - started
+
+            if not items or page * per_page >= total:
+                complete = True
+                break
+
+            if overlap and not full_walk:
+                if len(fetched_ids | self._ids) == total:
+                    break
+                _LOGGER.debug(
+                    "Attended history of %s changed below page %d, resyncing fully",
+                    userid,
+                    page,
+                )
+                full_walk = True
+
+            page += 1
+
+        # Only what was fetched (and, after a full walk, what disappeared)
+        # touches the statistics and the song index
+        for concert in fetched:
+            if (old := self._by_id.get(concert.id)) is not None:
+                self._remove(old)
+            self._add(concert)
+            self._by_id[concert.id] = concert
+
+        gone = fetched_ids - {concert.id for concert in fetched}
+        if complete:
+            gone |= self._by_id.keys() - fetched_ids
+        for setlist_id in gone & self._by_id.keys():
+            self._remove(self._by_id.pop(setlist_id))
+
+        if complete:
+            self.concerts = fetched
+            self._ids = fetched_ids
+            self._resync = False
+        else:
+            self.concerts = fetched + [
+                concert for concert in self.concerts if concert.id not in fetched_ids
+            ]
+            self._ids |= fetched_ids
+
+        _LOGGER.debug(
+            "Synced %d attended setlists for %s in %d request(s)",
+            len(self.concerts),
+            userid,
+            page,
+        )
+        return True
+
+    def _add(self, concert: Concert) -> None:
+        self.stats.add(concert)
+        self.songs.add(concert)
+
+    def _remove(self, concert: Concert) -> None:
+        self.stats.remove(concert)
+        self.songs.remove(concert)
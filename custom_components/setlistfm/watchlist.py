@@ -0,0 +1,198 @@
+"""Latest and upcoming setlists of watched artists, shared by all entries."""
+from __future__ import annotations
+
+import asyncio
+from datetime import date, datetime
+import logging
+import re
+
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from .api import SetlistFmClient, SetlistFmError, SetlistFmNotFoundError
+from .const import ARTIST_SETLISTS_TTL, WATCHLIST_CONCURRENCY, WATCHLIST_SLICE
+from .models import Concert
+from .scheduler import PRIORITY_POLL
+
+_LOGGER = logging.getLogger(__name__)
+
+MBID_PATTERN = re.compile(
+    r"^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$"
+)
+
+
+def parse_watchlist(value: str) -> list[str]:
+    """Split the watched artists option into MBIDs, keeping their order."""
+    return list(
+        dict.fromkeys(mbid.lower() for mbid in re.split(r"[\s,]+", value) if mbid)
+    )
+
+
+class ArtistSetlists:
+    """What we know about one watched artist."""
+
+    __slots__ = ("mbid", "name", "latest", "upcoming", "fetched_at")
+
+    def __init__(
+        self,
+        mbid: str,
+        name: str | None,
+        latest: Concert | None,
+        upcoming: list[Concert],
+        fetched_at: datetime,
+    ) -> None:
+        """Initialize the artist's setlists."""
+        self.mbid = mbid
+        self.name = name
+        self.latest = latest
+        self.upcoming = upcoming
+        self.fetched_at = fetched_at
+
+    def roll_over(self, today: date) -> None:
+        """Move shows that have happened from upcoming to latest."""
+        while self.upcoming and self.upcoming[0].date < today:
+            self.latest = self.upcoming.pop(0)
+
+    def as_dict(self) -> dict:
+        """Return the representation exposed in sensor attributes."""
+        return {
+            "mbid": self.mbid,
+            "name": self.name,
+            "latest": self.latest.as_dict() if self.latest else None,
+            "upcoming": [concert.as_dict() for concert in self.upcoming],
+        }
+
+
+class ArtistCache:
+    """Setlists of watched artists by MBID, shared by all config entries.
+
+    Each poll refreshes at most WATCHLIST_SLICE of an entry's artists, the
+    stalest first, and only those older than ARTIST_SETLISTS_TTL, so a long
+    watchlist is spread over several polls instead of hitting the API all at
+    once. Fetches run through a pool of WATCHLIST_CONCURRENCY, and an artist
+    watched by several entries is fetched once.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize an empty cache."""
+        self._hass = hass
+        self._artists: dict[str, ArtistSetlists] = {}
+        self._inflight: dict[str, asyncio.Task[bool]] = {}
+        self._semaphore = asyncio.Semaphore(WATCHLIST_CONCURRENCY)
+
+    def get(self, mbid: str) -> ArtistSetlists | None:
+        """Return the cached setlists of an artist, if any."""
+        return self._artists.get(mbid)
+
+    def roll_over(self, today: date) -> None:
+        """Move the shows that have happened to each artist's latest setlist."""
+        for artist in self._artists.values():
+            artist.roll_over(today)
+
+    def prune(self, watched: set[str]) -> None:
+        """Forget artists no entry watches any more."""
+        for mbid in self._artists.keys() - watched:
+            del self._artists[mbid]
+
+    def next_due(self, mbids: list[str]) -> datetime | None:
+        """Return when the next of these artists is due for a refresh."""
+        due: datetime | None = None
+        for mbid in mbids:
+            if (artist := self._artists.get(mbid)) is None:
+                return dt_util.utcnow()
+            expires = artist.fetched_at + ARTIST_SETLISTS_TTL
+            if due is None or expires < due:
+                due = expires
+        return due
+
+    def _due(self, mbids: list[str]) -> list[str]:
+        """Return the artists to refresh now, stalest first."""
+        expired = dt_util.utcnow() - ARTIST_SETLISTS_TTL
+        stale = [
+            mbid
+            for mbid in mbids
+            if (artist := self._artists.get(mbid)) is None
+            or artist.fetched_at <= expired
+        ]
+        stale.sort(
+            key=lambda mbid: (
+                self._artists[mbid].fetched_at
+                if mbid in self._artists
+                else datetime.min.replace(tzinfo=dt_util.UTC)
+            )
+        )
+        return stale[:WATCHLIST_SLICE]
+
+    async def async_refresh(
+        self, client: SetlistFmClient, mbids: list[str], priority: int = PRIORITY_POLL
+    ) -> None:
+        """Refresh the next slice of a watchlist.
+
+        Changed artists are replaced by new ArtistSetlists objects, so
+        callers can spot changes (made by any entry) by identity.
+        """
+        if not (due := self._due(mbids)):
+            return
+        results = await asyncio.gather(
+            *(self._async_fetch(client, mbid, priority) for mbid in due),
+            return_exceptions=True,
+        )
+        for mbid, result in zip(due, results):
+            if isinstance(result, SetlistFmError):
+                # Best effort: the entry's own data doesn't depend on it
+                _LOGGER.warning(
+                    "Error fetching setlists of artist %s: %s", mbid, result
+                )
+            elif isinstance(result, BaseException):
+                raise result
+
+    async def _async_fetch(
+        self, client: SetlistFmClient, mbid: str, priority: int
+    ) -> bool:
+        """Fetch an artist, joining a fetch already running for another entry."""
+        if (task := self._inflight.get(mbid)) is None:
+            task = self._inflight[mbid] = self._hass.async_create_task(
+                self._async_fetch_artist(client, mbid, priority)
+            )
+            task.add_done_callback(lambda _: self._inflight.pop(mbid, None))
+        return await asyncio.shield(task)
+
+    async def _async_fetch_artist(
+        self, client: SetlistFmClient, mbid: str, priority: int
+    ) -> bool:
+        """Fetch the newest page of an artist's setlists."""
+        cached = self._artists.get(mbid)
+        async with self._semaphore:
+            try:
+                data = await client.async_get_artist_setlists(
+                    mbid, priority=priority, conditional=cached is not None
+                )
+            except SetlistFmNotFoundError:
+                # Unknown MBID, or an artist without setlists
+                data = {"setlist": []}
+
+        now = dt_util.utcnow()
+        if data is None and cached is not None:
+            cached.fetched_at = now
+            return False
+
+        concerts = []
+        for item in (data or {}).get("setlist", []):
+            try:
+                concerts.append(Concert.from_setlist(item))
+            except (KeyError, ValueError, TypeError, AttributeError) as err:
+                _LOGGER.debug("Skipping setlist %s: %s", item.get("id"), err)
+
+        today = dt_util.now().date()
+        past = [concert for concert in concerts if concert.date < today]
+        self._artists[mbid] = ArtistSetlists(
+            mbid,
+            concerts[0].artist.name if concerts else None,
+            max(past, key=lambda concert: concert.date) if past else None,
+            sorted(
+                (concert for concert in concerts if concert.date >= today),
+                key=lambda concert: concert.date,
+            ),
+            now,
+        )
+        return True